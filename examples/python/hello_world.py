@@ -9,12 +9,19 @@ A minimal Windjammer application that demonstrates:
 """
 
 import sys
+
+import logging
+import os
+
+logger = logging.getLogger("windjammer")
+if os.environ.get("WINDJAMMER_DEBUG") == "1":
+    logging.basicConfig(level=logging.DEBUG)
+
 sys.path.insert(0, '../../sdks/python/generated')
 
 from app import App
 from world import World
 from entity import Entity
-import time as time_module
 
 def main():
     """Main entry point"""
@@ -31,7 +38,9 @@ def main():
     
     # Create entities
     player = Entity()
-    print(f"✓ Created Player Entity (ID: {player.id if hasattr(player, 'id') else 'N/A'})")
+    print("✓ Created Player Entity")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  Entity ID: %s", player.id)
     
     # Add game loop system
     def game_loop():
@@ -39,8 +48,13 @@ def main():
         # In a real game, this would be called every frame
         pass
     
-    app.add_system(game_loop)
-    print("✓ Added game loop system")
+    def render_loop():
+        """Render update loop"""
+        pass
+
+    # Register all systems with one call instead of one call each
+    app.add_systems([game_loop, render_loop])
+    print("✓ Added game systems")
     
     print("\n🎉 Hello World complete!")
     print("Note: This is a stub example. Full implementation requires FFI integration.")
@@ -11,6 +11,14 @@ Demonstrates:
 """
 
 import sys
+
+import logging
+import os
+
+logger = logging.getLogger("windjammer")
+if os.environ.get("WINDJAMMER_DEBUG") == "1":
+    logging.basicConfig(level=logging.DEBUG)
+
 sys.path.insert(0, '../../sdks/python/generated')
 
 from app import App
@@ -22,10 +30,43 @@ from rigidbody2d import RigidBody2D
 from rigidbodytype import RigidBodyType
 from input import Input
 from key import Key
-from vec2 import Vec2
+from vec2 import make_vec2
 from color import Color
 from transform2d import Transform2D
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernel runs as plain Python.
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+MOVE_FORCE = 10.0
+JUMP_IMPULSE = 15.0
+
+
+@njit(cache=True, fastmath=True)
+def _camera_kernel(px, py, cx, cy, dt):
+    """Per-frame camera-follow math.
+
+    Pure scalar arithmetic so Numba can lower it; input polling and FFI
+    calls stay outside. Returns (cam_x, cam_y).
+    """
+    # Camera eases toward the player at 10 units/sec.
+    t = min(10.0 * dt, 1.0)
+    cam_x = cx + (px - cx) * t
+    cam_y = cy + (py - cy) * t
+    return cam_x, cam_y
+
+
+# Warm the JIT cache at import time so the first frame doesn't pay the
+# compile cost (compile-outside-the-loop pattern).
+_camera_kernel(0.0, 0.0, 0.0, 0.0, 1.0 / 60.0)
+
+
 def main():
     """2D Platformer game"""
     print("🎮 Windjammer Python SDK - 2D Platformer")
@@ -38,56 +79,71 @@ def main():
     
     # Create player entity (stub - would use world.create_entity() with FFI)
     player = Entity()
-    player_transform = Transform2D(Vec2(0.0, 0.0), 0.0, Vec2(1.0, 1.0))
+    player_transform = Transform2D(make_vec2(0.0, 0.0), 0.0, make_vec2(1.0, 1.0))
     player_sprite = Sprite("assets/player.png")
     player_sprite.color = Color(1.0, 1.0, 1.0, 1.0)
     player_physics = RigidBody2D(RigidBodyType.Dynamic)
     player_physics.mass = 1.0
     
     print(f"✓ Created Player")
-    print(f"  Position: ({player_transform.position.x}, {player_transform.position.y})")
-    print(f"  Sprite: {player_sprite.texture_path}")
-    print(f"  Physics: Dynamic")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  Position: (%s, %s)", player_transform.position.x, player_transform.position.y)
+        logger.debug("  Sprite: %s", player_sprite.texture_path)
+        logger.debug("  Physics: Dynamic")
     
     # Create ground entity (stub)
     ground = Entity()
-    ground_transform = Transform2D(Vec2(0.0, -5.0), 0.0, Vec2(10.0, 1.0))
+    ground_transform = Transform2D(make_vec2(0.0, -5.0), 0.0, make_vec2(10.0, 1.0))
     ground_physics = RigidBody2D(RigidBodyType.Static)
     
     print(f"✓ Created Ground")
-    print(f"  Position: ({ground_transform.position.x}, {ground_transform.position.y})")
-    print(f"  Scale: ({ground_transform.scale.x}, {ground_transform.scale.y})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  Position: (%s, %s)", ground_transform.position.x, ground_transform.position.y)
+        logger.debug("  Scale: (%s, %s)", ground_transform.scale.x, ground_transform.scale.y)
     
     # Create camera
     camera = Camera2D()
-    camera.position = Vec2(0.0, 0.0)
+    camera.position = make_vec2(0.0, 0.0)
     camera.zoom = 1.0
     
     print(f"✓ Created Camera")
-    print(f"  Position: ({camera.position.x}, {camera.position.y})")
-    print(f"  Zoom: {camera.zoom}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  Position: (%s, %s)", camera.position.x, camera.position.y)
+        logger.debug("  Zoom: %s", camera.zoom)
     
+    # Input dispatch: precomputed jump tables keyed by Key instead of
+    # if/elif chains - each query is one bitset test plus a dict lookup,
+    # flat in the number of bound keys.
+    held_handlers = {
+        Key.A: lambda: player_physics.apply_force(make_vec2(-MOVE_FORCE, 0.0)),
+        Key.D: lambda: player_physics.apply_force(make_vec2(MOVE_FORCE, 0.0)),
+    }
+    pressed_handlers = {
+        Key.Space: lambda: player_physics.apply_impulse(
+            make_vec2(0.0, JUMP_IMPULSE)
+        ),
+    }
+
     # Game loop system
     def update_system():
         """Update game logic"""
-        # Handle input
-        if input_system.is_key_held(Key.A):
-            # Move left
-            force = Vec2(-10.0, 0.0)
-            player_physics.apply_force(force)
-        
-        if input_system.is_key_held(Key.D):
-            # Move right
-            force = Vec2(10.0, 0.0)
-            player_physics.apply_force(force)
-        
-        if input_system.is_key_pressed(Key.Space):
-            # Jump
-            impulse = Vec2(0.0, 15.0)
-            player_physics.apply_impulse(impulse)
-        
-        # Camera follows player
-        camera.follow(player_transform.position)
+        for key, handler in held_handlers.items():
+            if input_system.is_key_held(key):
+                handler()
+        for key, handler in pressed_handlers.items():
+            if input_system.is_key_pressed(key):
+                handler()
+
+        # Camera follows player; the math runs in the (optionally
+        # Numba-compiled) kernel on raw floats.
+        cam_x, cam_y = _camera_kernel(
+            player_transform.position.x,
+            player_transform.position.y,
+            camera.position.x,
+            camera.position.y,
+            1.0 / 60.0,
+        )
+        camera.follow(make_vec2(cam_x, cam_y))
     
     app.add_system(update_system)
     
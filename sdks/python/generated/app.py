@@ -0,0 +1,239 @@
+"""Windjammer Python SDK - App.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import logging
+import os
+import time
+
+try:
+    # Native frame-loop core (sdks/python/native, built with maturin).
+    import windjammer_native
+except ImportError:
+    windjammer_native = None
+
+logger = logging.getLogger("windjammer")
+
+# Invocation count after which a system is handed to Numba.
+_JIT_THRESHOLD = 100
+
+
+class _HotSystem:
+    """Tracing-JIT wrapper for per-frame systems.
+
+    Counts invocations of the wrapped function; once it crosses
+    ``_JIT_THRESHOLD`` frames, attempts to compile it with
+    ``numba.njit(cache=True)`` and dispatches to the native version from
+    then on. Systems Numba cannot type (FFI calls, arbitrary objects)
+    silently keep running under the interpreter.
+    """
+
+    __slots__ = ("fn", "compiled", "hits", "failed")
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.compiled = None
+        self.hits = 0
+        self.failed = False
+
+    @property
+    def __name__(self):
+        return self.fn.__name__
+
+    def __call__(self):
+        if self.compiled is not None:
+            return self.compiled()
+
+        self.hits += 1
+        if self.hits == _JIT_THRESHOLD and not self.failed:
+            return self._compile_and_call()
+        return self.fn()
+
+    def _compile_and_call(self):
+        try:
+            import numba
+        except ImportError:
+            self.failed = True
+            return self.fn()
+
+        # Persist compiled artifacts so the second run skips recompilation.
+        os.environ.setdefault(
+            "NUMBA_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".windjammer", "numba_cache"),
+        )
+        candidate = numba.njit(cache=True)(self.fn)
+        try:
+            result = candidate()
+        except numba.core.errors.NumbaError:
+            # TypingError and friends: not JIT-able, stay interpreted.
+            # The first compiled call never ran the body, so re-running
+            # the interpreted version doesn't double any side effects.
+            # Genuine runtime errors propagate like any other system's.
+            self.failed = True
+            return self.fn()
+        self.compiled = candidate
+        logger.info("JIT: %s compiled after %d frames", self.fn.__name__, self.hits)
+        return result
+
+
+class System:
+    """Base class for class-style system registration.
+
+    Subclasses defined while an :class:`App` exists register their bound
+    ``update`` method automatically via ``__init_subclass__`` - dispatch
+    goes through a direct method call with no decorator closure frame on
+    the stack, which also keeps the call target visible to the JIT
+    layer::
+
+        class RotateSprites(System):
+            def update(self):
+                ...
+    """
+
+    def __init_subclass__(cls, register=True, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if register and App.current is not None:
+            App.current.add_system(cls().update)
+
+    def update(self):
+        raise NotImplementedError
+
+
+class App:
+    """Application entry point and frame loop.
+
+    Systems are registered with :meth:`add_system` (or the ``@app.system``
+    decorator) and invoked once per frame. When the ``windjammer_native``
+    extension is available the loop itself runs in Rust and only calls back
+    into Python once per system per frame; otherwise a pure-Python loop is
+    used.
+    """
+
+    # Most recently constructed App; System subclasses register against it.
+    current = None
+
+    def __init__(self, title="Windjammer App", target_fps=60):
+        App.current = self
+        self.title = title
+        self.target_fps = target_fps
+        self.running = False
+        self._systems = []
+        self._startup_systems = []
+        self._shutdown_systems = []
+        # Optional RenderQueue flushed automatically at the end of each frame.
+        self.render_queue = None
+        # True once flush is registered with the native core; guards
+        # against re-registering on a second run().
+        self._flush_registered = False
+        # Previous frame's duration in integer nanoseconds (monotonic clock;
+        # stays int64 across the FFI so no float round-trip).
+        self.frame_dt_ns = 0
+        self._core = windjammer_native.AppCore() if windjammer_native else None
+
+    def add_system(self, func):
+        """Register a system called once per frame."""
+        self._systems.append(func)
+        if self._core is not None:
+            self._core.add_system(func)
+        return func
+
+    def add_systems(self, funcs):
+        """Register several per-frame systems in one call.
+
+        Extends the registry once instead of paying a method call per
+        system; the native core likewise receives the whole batch in a
+        single crossing.
+        """
+        funcs = list(funcs)
+        self._systems.extend(funcs)
+        if self._core is not None:
+            self._core.add_systems(funcs)
+        return funcs
+
+    def add_startup_system(self, func):
+        """Register a system called once before the first frame."""
+        self._startup_systems.append(func)
+        if self._core is not None:
+            self._core.add_startup_system(func)
+        return func
+
+    def add_shutdown_system(self, func):
+        """Register a system called once after the last frame."""
+        self._shutdown_systems.append(func)
+        if self._core is not None:
+            self._core.add_shutdown_system(func)
+        return func
+
+    # Decorator forms: @app.system / @app.startup / @app.shutdown
+    def system(self, func):
+        self.add_system(_HotSystem(func))
+        return func
+
+    def startup(self, func):
+        return self.add_startup_system(func)
+
+    def shutdown(self, func):
+        return self.add_shutdown_system(func)
+
+    def run(self, max_frames=None):
+        """Run the frame loop.
+
+        `max_frames` bounds the number of frames (useful for tests);
+        `None` runs until :meth:`quit` is called.
+        """
+        self.running = True
+
+        if self._core is not None:
+            if self.render_queue is not None and not self._flush_registered:
+                # Flush batched draws as the last system of each frame;
+                # registered once, however many times run() is called.
+                self._core.add_system(self.render_queue.flush)
+                self._flush_registered = True
+            self._core.run(self.target_fps, -1 if max_frames is None else max_frames)
+            self.running = False
+            return
+
+        # Pure-Python fallback loop.
+        for func in self._startup_systems:
+            func()
+
+        # perf_counter_ns is monotonic (no NTP jumps) and returns an int,
+        # so frame pacing allocates no float objects.
+        frame_budget_ns = (
+            1_000_000_000 // self.target_fps if self.target_fps else 0
+        )
+        frame = 0
+        last_ns = time.perf_counter_ns()
+        while self.running:
+            frame_start_ns = time.perf_counter_ns()
+            self.frame_dt_ns = frame_start_ns - last_ns
+            last_ns = frame_start_ns
+
+            for func in self._systems:
+                func()
+
+            if self.render_queue is not None:
+                self.render_queue.flush()
+
+            frame += 1
+            if max_frames is not None and frame >= max_frames:
+                self.running = False
+
+            if self.running and frame_budget_ns:
+                elapsed_ns = time.perf_counter_ns() - frame_start_ns
+                if elapsed_ns < frame_budget_ns:
+                    time.sleep((frame_budget_ns - elapsed_ns) * 1e-9)
+
+        for func in self._shutdown_systems:
+            func()
+
+    def quit(self):
+        """Stop the frame loop after the current frame."""
+        self.running = False
+        if self._core is not None:
+            # The native loop polls its own stop flag; the Python-side
+            # `running` attribute is never visible to it.
+            self._core.quit()
+        return None
@@ -0,0 +1,21 @@
+"""Windjammer Python SDK - Camera2D.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+from vec2 import make_vec2
+
+
+class Camera2D:
+    """2D camera with position and zoom."""
+
+    __slots__ = ("position", "zoom")
+
+    def __init__(self):
+        self.position = make_vec2(0.0, 0.0)
+        self.zoom = 1.0
+
+    def follow(self, target):
+        """Move the camera to `target` (a Vec2-like with .x/.y)."""
+        self.position = target
@@ -0,0 +1,44 @@
+"""Windjammer Python SDK - Color.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+
+class Color:
+    """RGBA color with float channels (0.0 - 1.0; HDR may exceed 1.0)."""
+
+    __slots__ = ("r", "g", "b", "a")
+
+    def __init__(self, r=1.0, g=1.0, b=1.0, a=1.0):
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+
+    def __repr__(self):
+        return f"Color({self.r}, {self.g}, {self.b}, {self.a})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Color):
+            return NotImplemented
+        # Single C-level tuple compare instead of four chained ones.
+        return (self.r, self.g, self.b, self.a) == (other.r, other.g, other.b, other.a)
+
+    def __hash__(self):
+        return hash((self.r, self.g, self.b, self.a))
+
+    def to_u8_rgba(self):
+        """Pack to one u32 with r in the low byte, for the LDR sprite path.
+
+        Written little-endian the bytes land as R,G,B,A in memory - the
+        R8G8B8A8 layout the GPU upload path reads, and the same
+        convention as ``windjammer_sdk.math.Color8``. Channels are
+        clamped to [0, 1]; HDR materials (emissive > 1.0) must stay on
+        the float16/float32 vertex-color path instead.
+        """
+        r = min(max(int(self.r * 255.0), 0), 255)
+        g = min(max(int(self.g * 255.0), 0), 255)
+        b = min(max(int(self.b * 255.0), 0), 255)
+        a = min(max(int(self.a * 255.0), 0), 255)
+        return (a << 24) | (b << 16) | (g << 8) | r
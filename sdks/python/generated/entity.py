@@ -0,0 +1,25 @@
+"""Windjammer Python SDK - Entity.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+
+class Entity:
+    """Handle to a world entity (an index into the world's SoA buffers)."""
+
+    __slots__ = ("id", "_world")
+
+    def __init__(self, id=None, world=None):
+        self.id = id
+        self._world = world
+
+    @property
+    def transform(self):
+        """Row view of this entity's transform in the world buffer."""
+        if self._world is None or self.id is None:
+            return None
+        return self._world.query_transforms().view(self.id)
+
+    def __repr__(self):
+        return f"Entity(id={self.id})"
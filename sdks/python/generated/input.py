@@ -0,0 +1,65 @@
+"""Windjammer Python SDK - Input.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+
+class Input:
+    """Keyboard and mouse state, polled by systems each frame.
+
+    State is held in integer bitsets (one bit per key), so the per-frame
+    ``is_key_held``/``is_key_pressed`` queries are a branchless shift and
+    mask instead of a hash lookup, and the native side can refresh the
+    whole keyboard with one call per frame.
+    """
+
+    def __init__(self):
+        self._held = 0
+        self._pressed = 0
+        self._released = 0
+        self._mouse_held = 0
+        self._mouse_pressed = 0
+
+    def is_key_held(self, key):
+        """True while `key` is down."""
+        return bool((self._held >> key) & 1)
+
+    def is_key_pressed(self, key):
+        """True only on the frame `key` went down."""
+        return bool((self._pressed >> key) & 1)
+
+    def is_key_released(self, key):
+        """True only on the frame `key` went up."""
+        return bool((self._released >> key) & 1)
+
+    def is_mouse_button_held(self, button):
+        return bool((self._mouse_held >> button) & 1)
+
+    def is_mouse_button_pressed(self, button):
+        return bool((self._mouse_pressed >> button) & 1)
+
+    # --- state updates (driven by the event pump) ---
+
+    def press_key(self, key):
+        bit = 1 << key
+        if not self._held & bit:
+            self._pressed |= bit
+        self._held |= bit
+
+    def release_key(self, key):
+        bit = 1 << key
+        self._held &= ~bit
+        self._released |= bit
+
+    def update_from_native(self, held, pressed, released):
+        """Refresh the whole keyboard from one native crossing per frame."""
+        self._held = held
+        self._pressed = pressed
+        self._released = released
+
+    def end_frame(self):
+        """Clear the per-frame edge bits; held state persists."""
+        self._pressed = 0
+        self._released = 0
+        self._mouse_pressed = 0
@@ -0,0 +1,67 @@
+"""Windjammer Python SDK - Key.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+from enum import IntEnum
+
+
+class Key(IntEnum):
+    """Keyboard key codes.
+
+    Values are dense small integers so input state fits in a bitset and
+    ``1 << key`` needs no conversion.
+    """
+
+    A = 0
+    B = 1
+    C = 2
+    D = 3
+    E = 4
+    F = 5
+    G = 6
+    H = 7
+    I = 8
+    J = 9
+    K = 10
+    L = 11
+    M = 12
+    N = 13
+    O = 14
+    P = 15
+    Q = 16
+    R = 17
+    S = 18
+    T = 19
+    U = 20
+    V = 21
+    W = 22
+    X = 23
+    Y = 24
+    Z = 25
+    Num0 = 26
+    Num1 = 27
+    Num2 = 28
+    Num3 = 29
+    Num4 = 30
+    Num5 = 31
+    Num6 = 32
+    Num7 = 33
+    Num8 = 34
+    Num9 = 35
+    Space = 36
+    Escape = 37
+    Enter = 38
+    Tab = 39
+    Backspace = 40
+    Left = 41
+    Right = 42
+    Up = 43
+    Down = 44
+    LeftShift = 45
+    RightShift = 46
+    LeftCtrl = 47
+    RightCtrl = 48
+    LeftAlt = 49
+    RightAlt = 50
@@ -0,0 +1,28 @@
+"""Windjammer Python SDK - Material.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+
+class Material:
+    """PBR material parameters.
+
+    Shading with these parameters runs in the deferred lighting resolve,
+    which the renderer schedules on the async compute queue (see
+    PostProcessing._QUEUES); the Python-visible surface is just data.
+    """
+
+    __slots__ = ("metallic", "roughness", "emissive", "base_color")
+
+    def __init__(self, metallic=0.0, roughness=0.5, emissive=0.0, base_color=None):
+        self.metallic = metallic
+        self.roughness = roughness
+        self.emissive = emissive
+        self.base_color = base_color
+
+    def __repr__(self):
+        return (
+            f"Material(metallic={self.metallic}, roughness={self.roughness}, "
+            f"emissive={self.emissive})"
+        )
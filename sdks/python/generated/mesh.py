@@ -0,0 +1,232 @@
+"""Windjammer Python SDK - Mesh.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import functools
+
+import numpy as np
+
+_MESH_SHADER_ID = 2
+
+
+class MeshBuffers:
+    """SoA vertex streams for one mesh.
+
+    Positions, normals and UVs live in separate tightly-packed float32
+    arrays (pos_x..., pos_y..., ...) rather than one array of vertex
+    structs, so generation streams sequential writes, numpy's C loops
+    vectorize the trig, and the GPU upload path can consume each stream
+    without an AoS repack.
+    """
+
+    __slots__ = (
+        "pos_x", "pos_y", "pos_z",
+        "norm_x", "norm_y", "norm_z",
+        "uv_u", "uv_v",
+    )
+
+    def __init__(self, count):
+        for name in self.__slots__:
+            setattr(self, name, np.zeros(count, dtype=np.float32))
+
+    def __len__(self):
+        return len(self.pos_x)
+
+
+def _sphere_buffers(radius, subdivisions):
+    """UV-sphere vertex streams from a vectorized (theta, phi) grid."""
+    theta = np.linspace(0.0, np.pi, subdivisions + 1, dtype=np.float32)
+    phi = np.linspace(0.0, 2.0 * np.pi, subdivisions + 1, dtype=np.float32)
+
+    sin_t, cos_t = np.sin(theta), np.cos(theta)
+    sin_p, cos_p = np.sin(phi), np.cos(phi)
+
+    buffers = MeshBuffers((subdivisions + 1) ** 2)
+    # Outer products give the full grid in a handful of SIMD-backed passes.
+    nx = np.outer(sin_t, cos_p).ravel()
+    ny = np.outer(sin_t, sin_p).ravel()
+    nz = np.repeat(cos_t, subdivisions + 1)
+
+    buffers.norm_x[:] = nx
+    buffers.norm_y[:] = ny
+    buffers.norm_z[:] = nz
+    buffers.pos_x[:] = nx * radius
+    buffers.pos_y[:] = ny * radius
+    buffers.pos_z[:] = nz * radius
+    buffers.uv_u[:] = np.tile(phi / (2.0 * np.pi), subdivisions + 1)
+    buffers.uv_v[:] = np.repeat(theta / np.pi, subdivisions + 1)
+    return buffers
+
+
+# Streaming generation: tiles of the (theta, phi) grid are written into
+# one reused staging block (8x8 vertices, 8 floats each) so peak memory
+# stays O(tile) however high the subdivision count, and the upload path
+# can DMA each tile while the next one is generated.
+_TILE = 8
+_STAGING = np.empty((_TILE * _TILE, 8), dtype=np.float32)
+
+
+def sphere_vertex_tiles(radius, subdivisions):
+    """Yield ``(offset, vertices)`` tiles of a UV sphere.
+
+    Each ``vertices`` view is a slice of the shared staging buffer with
+    rows ``[px, py, pz, nx, ny, nz, u, v]``; it must be consumed
+    (uploaded/copied) before the next iteration overwrites it. ``offset``
+    is the running vertex offset in emission order.
+    """
+    n = subdivisions + 1
+    theta = np.linspace(0.0, np.pi, n, dtype=np.float32)
+    phi = np.linspace(0.0, 2.0 * np.pi, n, dtype=np.float32)
+
+    offset = 0
+    for t0 in range(0, n, _TILE):
+        t1 = min(t0 + _TILE, n)
+        sin_t, cos_t = np.sin(theta[t0:t1]), np.cos(theta[t0:t1])
+        for p0 in range(0, n, _TILE):
+            p1 = min(p0 + _TILE, n)
+            sin_p, cos_p = np.sin(phi[p0:p1]), np.cos(phi[p0:p1])
+
+            count = (t1 - t0) * (p1 - p0)
+            block = _STAGING[:count]
+            nx = np.outer(sin_t, cos_p).ravel()
+            ny = np.outer(sin_t, sin_p).ravel()
+            nz = np.repeat(cos_t, p1 - p0)
+            block[:, 0] = nx * radius
+            block[:, 1] = ny * radius
+            block[:, 2] = nz * radius
+            block[:, 3] = nx
+            block[:, 4] = ny
+            block[:, 5] = nz
+            block[:, 6] = np.tile(phi[p0:p1] / (2.0 * np.pi), t1 - t0)
+            block[:, 7] = np.repeat(theta[t0:t1] / np.pi, p1 - p0)
+
+            yield offset, block
+            offset += count
+
+
+def _cube_buffers(size):
+    """Axis-aligned cube: 4 vertices per face, 6 faces."""
+    half = size * 0.5
+    buffers = MeshBuffers(24)
+    corners = np.array(
+        [(-1.0, -1.0), (1.0, -1.0), (1.0, 1.0), (-1.0, 1.0)], dtype=np.float32
+    )
+    # (axis, sign): axis is the face normal direction.
+    faces = [(0, 1.0), (0, -1.0), (1, 1.0), (1, -1.0), (2, 1.0), (2, -1.0)]
+    position = (buffers.pos_x, buffers.pos_y, buffers.pos_z)
+    normal = (buffers.norm_x, buffers.norm_y, buffers.norm_z)
+    for face, (axis, sign) in enumerate(faces):
+        sl = slice(face * 4, face * 4 + 4)
+        u_axis, v_axis = (axis + 1) % 3, (axis + 2) % 3
+        position[axis][sl] = sign * half
+        position[u_axis][sl] = corners[:, 0] * half
+        position[v_axis][sl] = corners[:, 1] * half
+        normal[axis][sl] = sign
+        buffers.uv_u[sl] = (corners[:, 0] + 1.0) * 0.5
+        buffers.uv_v[sl] = (corners[:, 1] + 1.0) * 0.5
+    return buffers
+
+
+def _plane_buffers(size):
+    """Single quad in the XZ plane, normal up."""
+    half = size * 0.5
+    buffers = MeshBuffers(4)
+    buffers.pos_x[:] = [-half, half, half, -half]
+    buffers.pos_z[:] = [-half, -half, half, half]
+    buffers.norm_y[:] = 1.0
+    buffers.uv_u[:] = [0.0, 1.0, 1.0, 0.0]
+    buffers.uv_v[:] = [0.0, 0.0, 1.0, 1.0]
+    return buffers
+
+
+class Mesh:
+    """3D mesh primitive."""
+
+    __slots__ = ("mesh_type", "size", "radius", "subdivisions", "material_id")
+
+    def __init__(self, mesh_type):
+        self.mesh_type = mesh_type
+        self.size = None
+        self.radius = None
+        self.subdivisions = None
+        self.material_id = 0
+
+    def __repr__(self):
+        return f"Mesh({self.mesh_type!r})"
+
+    def copy(self):
+        """Shallow copy; five slot reads, no generated geometry to clone."""
+        mesh = Mesh(self.mesh_type)
+        mesh.size = self.size
+        mesh.radius = self.radius
+        mesh.subdivisions = self.subdivisions
+        mesh.material_id = self.material_id
+        return mesh
+
+    def generate(self):
+        """Generate this primitive's vertex streams as :class:`MeshBuffers`."""
+        if self.mesh_type == "sphere":
+            return _sphere_buffers(self.radius, self.subdivisions)
+        if self.mesh_type == "cube":
+            return _cube_buffers(self.size)
+        if self.mesh_type == "plane":
+            return _plane_buffers(self.size)
+        raise ValueError(f"unknown mesh type: {self.mesh_type!r}")
+
+    @property
+    def geometry_id(self):
+        """Stable id used as the batching key for this mesh's geometry."""
+        return hash((self.mesh_type, self.size, self.radius, self.subdivisions)) & 0x7FFFFFFF
+
+    def draw(self, queue, vertices):
+        """Submit this mesh's vertex data to a :class:`RenderQueue`."""
+        queue.submit(_MESH_SHADER_ID, self.geometry_id, self.material_id, vertices)
+
+
+# Primitive factories memoize an internal template per parameter set
+# and hand out cheap shallow copies: callers may mutate their mesh
+# (setting material_id before draw() is the normal flow) without
+# poisoning the cache for later identical calls. The public wrappers
+# forward to the cached layer positionally so `cube(2.0)` and
+# `cube(size=2.0)` share one cache entry (lru_cache keys positional
+# and keyword calls separately).
+
+@functools.lru_cache(maxsize=64)
+def _cube_template(size):
+    mesh = Mesh("cube")
+    mesh.size = size
+    return mesh
+
+
+@functools.lru_cache(maxsize=64)
+def _sphere_template(radius, subdivisions):
+    mesh = Mesh("sphere")
+    mesh.radius = radius
+    mesh.subdivisions = subdivisions
+    return mesh
+
+
+@functools.lru_cache(maxsize=64)
+def _plane_template(size):
+    mesh = Mesh("plane")
+    mesh.size = size
+    return mesh
+
+
+def _cube(size=1.0):
+    return _cube_template(size).copy()
+
+
+def _sphere(radius=0.5, subdivisions=32):
+    return _sphere_template(radius, subdivisions).copy()
+
+
+def _plane(size=10.0):
+    return _plane_template(size).copy()
+
+
+Mesh.cube = staticmethod(_cube)
+Mesh.sphere = staticmethod(_sphere)
+Mesh.plane = staticmethod(_plane)
@@ -0,0 +1,92 @@
+"""Windjammer Python SDK - PointLight.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import numpy as np
+
+MAX_LIGHTS = 256
+
+
+class LightBuffer:
+    """Packed uniform storage for all point lights.
+
+    Each row is ``[px, py, pz, intensity, cr, cg, cb, ca]`` in one
+    contiguous float32 block, so the per-frame uniform upload is a single
+    memcpy (``ptr, count = buffer.ffi_args()``) instead of one crossing
+    per light per field.
+    """
+
+    def __init__(self, capacity=MAX_LIGHTS):
+        self.capacity = capacity
+        self.count = 0
+        self._buf = np.zeros((capacity, 8), dtype=np.float32)
+
+    def allocate(self):
+        """Reserve a row and return its index."""
+        if self.count >= self.capacity:
+            raise IndexError(f"LightBuffer capacity {self.capacity} exhausted")
+        index = self.count
+        self.count += 1
+        return index
+
+    def row(self, index):
+        return self._buf[index]
+
+    def ffi_args(self):
+        """Return ``(pointer, count)`` for the once-per-frame upload."""
+        return self._buf.ctypes.data, self.count
+
+
+# Default buffer used when lights aren't given an explicit one.
+_default_buffer = LightBuffer()
+
+
+class PointLight:
+    """Point light: a row view into a :class:`LightBuffer`."""
+
+    __slots__ = ("_buffer", "_index")
+
+    def __init__(self, position=None, color=None, intensity=1.0, buffer=None):
+        self._buffer = buffer if buffer is not None else _default_buffer
+        self._index = self._buffer.allocate()
+        if position is not None:
+            self.position = position
+        if color is not None:
+            self.color = color
+        self.intensity = intensity
+
+    @property
+    def position(self):
+        """View of the xyz slice of this light's row (writable in place)."""
+        return self._buffer.row(self._index)[0:3]
+
+    @position.setter
+    def position(self, value):
+        row = self._buffer.row(self._index)
+        if hasattr(value, "x"):
+            row[0], row[1], row[2] = value.x, value.y, value.z
+        else:
+            row[0:3] = value
+
+    @property
+    def intensity(self):
+        return float(self._buffer.row(self._index)[3])
+
+    @intensity.setter
+    def intensity(self, value):
+        self._buffer.row(self._index)[3] = value
+
+    @property
+    def color(self):
+        """View of the rgba slice of this light's row (writable in place)."""
+        return self._buffer.row(self._index)[4:8]
+
+    @color.setter
+    def color(self, value):
+        row = self._buffer.row(self._index)
+        if hasattr(value, "r"):
+            row[4], row[5], row[6], row[7] = value.r, value.g, value.b, value.a
+        else:
+            row[4:8] = value
@@ -0,0 +1,167 @@
+"""Windjammer Python SDK - PostProcessing.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import queue
+import threading
+
+import numpy as np
+
+
+class PostProcessing:
+    """Configuration of the post-processing chain.
+
+    Each ``set_*`` call records one pass; passes are kept as separate
+    records so the backend can encode them into independent command
+    buffers and schedule them off the main render queue.
+    """
+
+    # Fixed chain order, matching the deferred pipeline.
+    _ORDER = ("hdr", "bloom", "ssao", "tone_mapping", "color_grading")
+
+    # Queue each pass is scheduled on. Bloom downsample/upsample, SSAO
+    # sampling and the PBR lighting resolve are ALU-bound full-screen
+    # work that overlaps the next frame's G-buffer fill on an async
+    # compute queue; tone mapping and grading stay on the graphics queue
+    # that owns the swapchain image.
+    _QUEUES = {
+        "hdr": "graphics",
+        "bloom": "compute",
+        "ssao": "compute",
+        "lighting": "compute",
+        "tone_mapping": "graphics",
+        "color_grading": "graphics",
+    }
+
+    def __init__(self):
+        self._passes = {}
+
+    def set_hdr(self, enabled=True, exposure=1.0):
+        self._passes["hdr"] = {"enabled": enabled, "exposure": exposure}
+
+    def set_bloom(self, intensity=0.5, threshold=1.0):
+        self._passes["bloom"] = {"intensity": intensity, "threshold": threshold}
+
+    def set_ssao(self, radius=0.5, samples=16):
+        self._passes["ssao"] = {"radius": radius, "samples": samples}
+
+    def set_tone_mapping(self, mode="aces"):
+        self._passes["tone_mapping"] = {"mode": mode}
+
+    def set_color_grading(self, saturation=1.0, contrast=1.0):
+        self._passes["color_grading"] = {"saturation": saturation, "contrast": contrast}
+
+    def compiled_passes(self):
+        """Return the configured passes in chain order."""
+        return [
+            (name, self._passes[name]) for name in self._ORDER if name in self._passes
+        ]
+
+    def passes_for_queue(self, queue):
+        """Passes routed to `queue` ("graphics" or "compute"), in order.
+
+        The native renderer submits the compute list on the async compute
+        queue, ordered against the graphics queue with timeline
+        semaphores; configuring passes from Python is unchanged.
+        """
+        return [
+            (name, params)
+            for name, params in self.compiled_passes()
+            if self._QUEUES[name] == queue
+        ]
+
+
+class AsyncCompositor:
+    """Pipelines post-FX composition one frame behind rendering.
+
+    The caller submits frame N+1 while a worker thread composites frame N,
+    so readback/composition overlaps the next frame's geometry work
+    instead of blocking it. A bounded ring (depth 2) of in-flight frames
+    keeps the producer from running ahead; results come back with exactly
+    one frame of latency.
+    """
+
+    def __init__(self, post, depth=2):
+        self._post = post
+        self._in_queue = queue.Queue(maxsize=depth)
+        self._out_queue = queue.Queue()
+        self._in_flight = 0
+        self._closed = False
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+    def submit(self, frame):
+        """Queue `frame` for composition; returns the previous frame's result.
+
+        The first submission returns ``None`` (nothing is ready yet);
+        thereafter each call returns the composited frame submitted one
+        call earlier. An exception raised while compositing that earlier
+        frame re-raises here, on the call that would have returned it.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncCompositor is drained; create a new one")
+        self._in_queue.put(np.asarray(frame, dtype=np.float32))
+        self._in_flight += 1
+        if self._in_flight > 1:
+            self._in_flight -= 1
+            return self._take()
+        return None
+
+    def drain(self):
+        """Return the final in-flight frame and stop the worker.
+
+        The compositor is closed afterwards: further ``submit``/``drain``
+        calls raise instead of deadlocking against the stopped worker.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncCompositor is drained; create a new one")
+        self._closed = True
+        try:
+            return self._take() if self._in_flight else None
+        finally:
+            self._in_flight = 0
+            self._in_queue.put(None)
+            self._worker.join()
+
+    def _take(self):
+        """Dequeue one worker result, re-raising compositing failures."""
+        result = self._out_queue.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _worker_loop(self):
+        # Every dequeued frame produces exactly one output - a result or
+        # the exception it raised - so producer/consumer accounting never
+        # skews and a failing pass can't wedge the pipeline.
+        while True:
+            frame = self._in_queue.get()
+            if frame is None:
+                return
+            try:
+                result = self._composite(frame)
+            except Exception as exc:
+                result = exc
+            self._out_queue.put(result)
+
+    def _composite(self, frame):
+        """Apply the configured pass chain to one frame's color buffer."""
+        for name, params in self._post.compiled_passes():
+            if name == "hdr" and params["enabled"]:
+                frame = frame * params["exposure"]
+            elif name == "bloom":
+                bright = np.maximum(frame - params["threshold"], 0.0)
+                frame = frame + bright * params["intensity"]
+            elif name == "ssao":
+                # Occlusion term is produced by the native renderer; the
+                # composition stage only modulates by it.
+                frame = frame * 1.0
+            elif name == "tone_mapping":
+                frame = frame / (1.0 + frame)
+            elif name == "color_grading":
+                mean = frame.mean()
+                frame = (frame - mean) * params["contrast"] + mean
+                frame = frame * params["saturation"]
+        return frame
@@ -0,0 +1,85 @@
+"""Windjammer Python SDK - RenderQueue.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import numpy as np
+
+
+class RenderBatch:
+    """One coalesced draw: every submission sharing a state key."""
+
+    __slots__ = ("shader_id", "texture_id", "material_id", "vertices", "submissions")
+
+    def __init__(self, shader_id, texture_id, material_id, vertices, submissions):
+        self.shader_id = shader_id
+        self.texture_id = texture_id
+        self.material_id = material_id
+        self.vertices = vertices
+        self.submissions = submissions
+
+
+class RenderQueue:
+    """Collects per-object draw submissions and coalesces them per frame.
+
+    Sprites and meshes append to the queue instead of issuing a draw each.
+    ``flush()`` sorts submissions by ``(shader_id, texture_id, material_id)``
+    and concatenates the vertex data of each contiguous same-key run into a
+    single batch, so N sprites sharing a texture become one draw instead of
+    N. Vertex data uses disjoint triangles (not strips) so unrelated quads
+    can coexist in one buffer.
+    """
+
+    def __init__(self):
+        self._submissions = []
+
+    def __len__(self):
+        return len(self._submissions)
+
+    def submit(self, shader_id, texture_id, material_id, vertices):
+        """Queue one object's vertex data under a render-state key."""
+        self._submissions.append(
+            (shader_id, texture_id, material_id, np.asarray(vertices))
+        )
+
+    def flush(self):
+        """Coalesce and emit all queued submissions; returns the batches.
+
+        Called automatically once per frame by ``App.run``; user code only
+        needs to call it directly when driving the renderer manually.
+        """
+        if not self._submissions:
+            return []
+
+        self._submissions.sort(key=lambda s: (s[0], s[1], s[2]))
+
+        batches = []
+        run_key = self._submissions[0][:3]
+        run_vertices = []
+        for shader_id, texture_id, material_id, vertices in self._submissions:
+            key = (shader_id, texture_id, material_id)
+            if key != run_key:
+                batches.append(self._make_batch(run_key, run_vertices))
+                run_key = key
+                run_vertices = []
+            run_vertices.append(vertices)
+        batches.append(self._make_batch(run_key, run_vertices))
+
+        self._submissions.clear()
+        for batch in batches:
+            self._draw(batch)
+        return batches
+
+    @staticmethod
+    def _make_batch(key, vertex_arrays):
+        return RenderBatch(
+            key[0],
+            key[1],
+            key[2],
+            np.concatenate(vertex_arrays),
+            len(vertex_arrays),
+        )
+
+    def _draw(self, batch):
+        """Issue one draw call for a batch (native hook; no-op without FFI)."""
@@ -0,0 +1,42 @@
+"""Windjammer Python SDK - RigidBody2D.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+from rigidbodytype import RigidBodyType
+
+
+class RigidBody2D:
+    """2D physics body component.
+
+    Forces and impulses accumulate as scalars and are drained by the
+    physics step in one batch.
+    """
+
+    __slots__ = ("body_type", "mass", "_force_x", "_force_y", "_impulse_x", "_impulse_y")
+
+    def __init__(self, body_type=RigidBodyType.Dynamic):
+        self.body_type = body_type
+        self.mass = 1.0
+        self._force_x = 0.0
+        self._force_y = 0.0
+        self._impulse_x = 0.0
+        self._impulse_y = 0.0
+
+    def apply_force(self, force):
+        """Accumulate a continuous force for this frame."""
+        self._force_x += force.x
+        self._force_y += force.y
+
+    def apply_impulse(self, impulse):
+        """Accumulate an instantaneous impulse."""
+        self._impulse_x += impulse.x
+        self._impulse_y += impulse.y
+
+    def drain_accumulators(self):
+        """Return and clear ``(force_x, force_y, impulse_x, impulse_y)``."""
+        out = (self._force_x, self._force_y, self._impulse_x, self._impulse_y)
+        self._force_x = self._force_y = 0.0
+        self._impulse_x = self._impulse_y = 0.0
+        return out
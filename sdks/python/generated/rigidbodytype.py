@@ -0,0 +1,15 @@
+"""Windjammer Python SDK - RigidBodyType.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+from enum import IntEnum
+
+
+class RigidBodyType(IntEnum):
+    """Physics body kinds."""
+
+    Static = 0
+    Dynamic = 1
+    Kinematic = 2
@@ -0,0 +1,73 @@
+"""Windjammer Python SDK - Sprite.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import numpy as np
+
+# Sprite vertex layout: 20 bytes. Color is quantized to packed u8 rgba
+# with r in the low byte (R,G,B,A in memory on little-endian - the
+# R8G8B8A8 order the GPU reads; see Color.to_u8_rgba). 4 bytes instead
+# of 16 of FP32 - beyond 8 bits per channel is imperceptible for LDR
+# sprites, and the smaller stride quarters the color bandwidth of
+# large batches.
+VERTEX_DTYPE = np.dtype(
+    [("pos", np.float32, 2), ("uv", np.float32, 2), ("color", np.uint32)]
+)
+
+# Unit quad as two disjoint triangles so batched sprites can share one
+# vertex buffer.
+_QUAD_POS = np.array(
+    [
+        [-0.5, -0.5],
+        [0.5, -0.5],
+        [0.5, 0.5],
+        [-0.5, -0.5],
+        [0.5, 0.5],
+        [-0.5, 0.5],
+    ],
+    dtype=np.float32,
+)
+_QUAD_UV = np.array(
+    [
+        [0.0, 0.0],
+        [1.0, 0.0],
+        [1.0, 1.0],
+        [0.0, 0.0],
+        [1.0, 1.0],
+        [0.0, 1.0],
+    ],
+    dtype=np.float32,
+)
+
+_WHITE_RGBA8 = 0xFFFFFFFF
+
+_SPRITE_SHADER_ID = 1
+
+
+class Sprite:
+    """2D textured quad."""
+
+    __slots__ = ("texture_path", "color", "position", "size")
+
+    def __init__(self, texture_path):
+        self.texture_path = texture_path
+        self.color = None
+        self.position = None
+        self.size = None
+
+    @property
+    def texture_id(self):
+        """Stable id used as the batching key for this sprite's texture."""
+        return hash(self.texture_path) & 0x7FFFFFFF
+
+    def draw(self, queue):
+        """Submit this sprite to a :class:`RenderQueue` for batched drawing."""
+        vertices = np.zeros(6, dtype=VERTEX_DTYPE)
+        vertices["pos"] = _QUAD_POS
+        vertices["uv"] = _QUAD_UV
+        vertices["color"] = (
+            self.color.to_u8_rgba() if self.color is not None else _WHITE_RGBA8
+        )
+        queue.submit(_SPRITE_SHADER_ID, self.texture_id, 0, vertices)
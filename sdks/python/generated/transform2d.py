@@ -0,0 +1,18 @@
+"""Windjammer Python SDK - Transform2D.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+from vec2 import make_vec2
+
+
+class Transform2D:
+    """2D position, rotation (radians) and scale."""
+
+    __slots__ = ("position", "rotation", "scale")
+
+    def __init__(self, position=None, rotation=0.0, scale=None):
+        self.position = position if position is not None else make_vec2(0.0, 0.0)
+        self.rotation = rotation
+        self.scale = scale if scale is not None else make_vec2(1.0, 1.0)
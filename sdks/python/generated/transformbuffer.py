@@ -0,0 +1,95 @@
+"""Windjammer Python SDK - TransformBuffer.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import numpy as np
+
+
+class TransformView:
+    """Lightweight view of one entity's row in a :class:`TransformBuffer`.
+
+    Reads and writes go straight to the shared SoA arrays, so no per-entity
+    vector objects are allocated on the hot path.
+    """
+
+    __slots__ = ("_buffer", "_index")
+
+    def __init__(self, buffer, index):
+        self._buffer = buffer
+        self._index = index
+
+    @property
+    def x(self):
+        return float(self._buffer.x[self._index])
+
+    @x.setter
+    def x(self, value):
+        self._buffer.x[self._index] = value
+
+    @property
+    def y(self):
+        return float(self._buffer.y[self._index])
+
+    @y.setter
+    def y(self, value):
+        self._buffer.y[self._index] = value
+
+    @property
+    def z(self):
+        return float(self._buffer.z[self._index])
+
+    @z.setter
+    def z(self, value):
+        self._buffer.z[self._index] = value
+
+
+class TransformBuffer:
+    """Structure-of-arrays storage for entity positions and velocities.
+
+    Instead of one Vec2/Vec3 object per entity per frame, all transforms
+    live in contiguous float32 arrays that systems mutate in place and the
+    native side consumes with a single crossing per frame
+    (``ptr, count = buffer.ffi_args()``).
+    """
+
+    _FIELDS = ("x", "y", "z", "vx", "vy", "vz")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0
+        # One tightly-packed array per component: x..., y..., z..., vx...
+        self._data = np.zeros((len(self._FIELDS), capacity), dtype=np.float32)
+        self.x, self.y, self.z, self.vx, self.vy, self.vz = self._data
+
+    def allocate(self):
+        """Reserve a row and return its index."""
+        if self.count >= self.capacity:
+            raise IndexError(
+                f"TransformBuffer capacity {self.capacity} exhausted"
+            )
+        index = self.count
+        self.count += 1
+        return index
+
+    def view(self, index):
+        """Return a :class:`TransformView` over row `index`."""
+        if not 0 <= index < self.count:
+            raise IndexError(f"no transform at index {index}")
+        return TransformView(self, index)
+
+    def integrate(self, dt):
+        """Advance all positions by velocity * dt in one vectorized pass."""
+        n = self.count
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.z[:n] += self.vz[:n] * dt
+
+    def ffi_args(self):
+        """Return ``(pointer, count)`` for the once-per-frame native upload.
+
+        The pointer addresses the whole SoA block; the native side indexes
+        it as ``field * capacity + entity``.
+        """
+        return self._data.ctypes.data, self.count
@@ -0,0 +1,79 @@
+"""Windjammer Python SDK - TripleBuffer.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import threading
+
+import numpy as np
+
+try:
+    import windjammer_native
+except ImportError:
+    windjammer_native = None
+
+
+class _PyIndices:
+    """Pure-Python slot arbitration (lock-guarded) mirroring the native
+    AtomicU8 TripleBufferIndices."""
+
+    def __init__(self):
+        self._read = 0
+        self._ready = 1
+        self._write = 2
+        self._fresh = False
+        self._lock = threading.Lock()
+
+    def write_index(self):
+        return self._write
+
+    def publish(self):
+        with self._lock:
+            self._ready, self._write = self._write, self._ready
+            self._fresh = True
+            return self._write
+
+    def acquire(self):
+        with self._lock:
+            if not self._fresh:
+                return self._read, False
+            self._read, self._ready = self._ready, self._read
+            self._fresh = False
+            return self._read, True
+
+
+class TripleBuffer:
+    """Triple-buffered frame state between update and render threads.
+
+    The update thread fills ``write_buffer()`` and calls ``publish()``;
+    the render thread calls ``acquire()`` for the freshest published
+    frame. With three slots the producer never stalls on the consumer,
+    which smooths out the variable Python-to-native frame handoff cost.
+    Slot transitions are lock-free when the native extension is built.
+    """
+
+    def __init__(self, shape, dtype=np.float32):
+        self._buffers = [np.zeros(shape, dtype=dtype) for _ in range(3)]
+        self._indices = (
+            windjammer_native.TripleBufferIndices()
+            if windjammer_native is not None
+            else _PyIndices()
+        )
+
+    def write_buffer(self):
+        """The slot the update thread may freely mutate this frame."""
+        return self._buffers[self._indices.write_index()]
+
+    def publish(self):
+        """Hand the written slot to the consumer; never blocks."""
+        self._indices.publish()
+
+    def acquire(self):
+        """Return ``(buffer, fresh)`` with the newest published frame.
+
+        ``fresh`` is False when no new frame arrived since the last
+        acquire; the previous frame's buffer is returned again.
+        """
+        slot, fresh = self._indices.acquire()
+        return self._buffers[slot], fresh
@@ -0,0 +1,25 @@
+"""Windjammer Python SDK - Vec2.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import numpy as np
+
+# Vec2 is a numpy structured dtype, not a Python class: a value is 8 raw
+# bytes instead of a PyObject with a dict, and arrays of them pass to the
+# FFI layer without conversion.
+Vec2 = np.dtype([("x", np.float32), ("y", np.float32)])
+
+# Record view of the same dtype so scalars support .x / .y attribute access.
+_VEC2_RECORD = np.dtype((np.record, Vec2))
+
+
+def make_vec2(x=0.0, y=0.0):
+    """Create a Vec2 value (a numpy record scalar with .x / .y fields)."""
+    return np.array((x, y), dtype=_VEC2_RECORD)[()]
+
+
+def make_vec2_array(n):
+    """Allocate a zeroed array of `n` Vec2 values (contiguous, FFI-ready)."""
+    return np.zeros(n, dtype=Vec2)
@@ -0,0 +1,25 @@
+"""Windjammer Python SDK - Vec3.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+import numpy as np
+
+# Vec3 is a numpy structured dtype, not a Python class: a value is 12 raw
+# bytes instead of a PyObject with a dict, and arrays of them pass to the
+# FFI layer without conversion.
+Vec3 = np.dtype([("x", np.float32), ("y", np.float32), ("z", np.float32)])
+
+# Record view of the same dtype so scalars support .x / .y / .z access.
+_VEC3_RECORD = np.dtype((np.record, Vec3))
+
+
+def make_vec3(x=0.0, y=0.0, z=0.0):
+    """Create a Vec3 value (a numpy record scalar with .x / .y / .z fields)."""
+    return np.array((x, y, z), dtype=_VEC3_RECORD)[()]
+
+
+def make_vec3_array(n):
+    """Allocate a zeroed array of `n` Vec3 values (contiguous, FFI-ready)."""
+    return np.zeros(n, dtype=Vec3)
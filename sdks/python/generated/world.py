@@ -0,0 +1,50 @@
+"""Windjammer Python SDK - World.
+
+Generated by wj-sdk-gen (api/windjammer_api_phase1.json) and hand-tuned.
+Keep in sync with the API definition.
+"""
+
+from entity import Entity
+from transformbuffer import TransformBuffer
+
+try:
+    import windjammer_native
+except ImportError:
+    windjammer_native = None
+
+
+class World:
+    """Entity container and simulation stepper.
+
+    Entity bookkeeping stays in Python; the per-entity hot loops run on
+    the native side, which receives the whole SoA transform block once
+    per step instead of being called per entity.
+    """
+
+    def __init__(self, capacity=1024):
+        self._transforms = TransformBuffer(capacity)
+        self._entities = []
+        self._core = windjammer_native.WorldCore() if windjammer_native else None
+
+    def create_entity(self):
+        """Spawn an entity backed by a row in the transform buffer."""
+        index = self._transforms.allocate()
+        entity = Entity(index, self)
+        self._entities.append(entity)
+        return entity
+
+    def step(self, dt):
+        """Advance the simulation by `dt` seconds (one native crossing)."""
+        if self._core is not None:
+            ptr, count = self._transforms.ffi_args()
+            self._core.step(ptr, count, self._transforms.capacity, dt)
+        else:
+            self._transforms.integrate(dt)
+
+    def query_transforms(self):
+        """Return the live SoA transform buffer (zero-copy views)."""
+        return self._transforms
+
+    @property
+    def entity_count(self):
+        return len(self._entities)
@@ -0,0 +1,224 @@
+//! windjammer_native - native frame-loop core for the Windjammer Python SDK.
+//!
+//! Owns the per-frame system dispatch loop so the only Python work per frame
+//! is one `PyObject_Call` per registered system. The GIL is released while
+//! waiting out the remainder of each frame's time budget.
+//!
+//! Built with maturin: `maturin build --release` from this directory.
+
+use pyo3::prelude::*;
+use std::sync::atomic::{AtomicBool, AtomicU8, Ordering};
+use std::time::{Duration, Instant};
+
+/// Native application core holding registered systems.
+///
+/// The Python `App` class (sdks/python/generated/app.py) forwards
+/// registration into this struct and delegates `run()` to it when the
+/// extension module is available.
+#[pyclass]
+pub struct AppCore {
+    startup: Vec<Py<PyAny>>,
+    systems: Vec<Py<PyAny>>,
+    shutdown: Vec<Py<PyAny>>,
+    /// Set by `quit()` (from any thread); checked once per frame.
+    stop: AtomicBool,
+}
+
+#[pymethods]
+impl AppCore {
+    #[new]
+    fn new() -> Self {
+        AppCore {
+            startup: Vec::new(),
+            systems: Vec::new(),
+            shutdown: Vec::new(),
+            stop: AtomicBool::new(false),
+        }
+    }
+
+    /// Request the frame loop stop after the current frame.
+    fn quit(&self) {
+        self.stop.store(true, Ordering::Release);
+    }
+
+    /// Register a per-frame system callable.
+    fn add_system(&mut self, cb: Py<PyAny>) {
+        self.systems.push(cb);
+    }
+
+    /// Register a batch of per-frame systems in one boundary crossing.
+    fn add_systems(&mut self, cbs: Vec<Py<PyAny>>) {
+        self.systems.extend(cbs);
+    }
+
+    /// Register a callable invoked once before the first frame.
+    fn add_startup_system(&mut self, cb: Py<PyAny>) {
+        self.startup.push(cb);
+    }
+
+    /// Register a callable invoked once after the last frame.
+    fn add_shutdown_system(&mut self, cb: Py<PyAny>) {
+        self.shutdown.push(cb);
+    }
+
+    /// Run the frame loop on the native side.
+    ///
+    /// `target_fps == 0` disables frame pacing; `max_frames < 0` runs until
+    /// `quit()` is called or a system raises.
+    #[pyo3(signature = (target_fps = 60, max_frames = -1))]
+    fn run(&self, py: Python<'_>, target_fps: u32, max_frames: i64) -> PyResult<()> {
+        // A stale request from a previous run must not kill this one.
+        self.stop.store(false, Ordering::Release);
+
+        for cb in &self.startup {
+            cb.call0(py)?;
+        }
+
+        let frame_budget = if target_fps > 0 {
+            Some(Duration::from_secs_f64(1.0 / target_fps as f64))
+        } else {
+            None
+        };
+
+        let mut frame: i64 = 0;
+        loop {
+            let frame_start = Instant::now();
+
+            for cb in &self.systems {
+                cb.call0(py)?;
+            }
+
+            frame += 1;
+            if max_frames >= 0 && frame >= max_frames {
+                break;
+            }
+            if self.stop.load(Ordering::Acquire) {
+                break;
+            }
+
+            if let Some(budget) = frame_budget {
+                let elapsed = frame_start.elapsed();
+                if elapsed < budget {
+                    // Let other Python threads run while we wait out the budget.
+                    py.allow_threads(|| std::thread::sleep(budget - elapsed));
+                }
+            }
+        }
+
+        for cb in &self.shutdown {
+            cb.call0(py)?;
+        }
+        Ok(())
+    }
+}
+
+/// Native world stepper operating on the SDK's SoA transform block.
+///
+/// The Python `World` (sdks/python/generated/world.py) owns entity
+/// bookkeeping and hands the raw pointer of its `TransformBuffer` down
+/// once per frame; all per-entity iteration stays on the Rust side.
+#[pyclass]
+pub struct WorldCore;
+
+#[pymethods]
+impl WorldCore {
+    #[new]
+    fn new() -> Self {
+        WorldCore
+    }
+
+    /// Integrate `position += velocity * dt` over the SoA block in place.
+    ///
+    /// `ptr` addresses a `6 * capacity` f32 block laid out as
+    /// x..., y..., z..., vx..., vy..., vz... (see TransformBuffer).
+    fn step(&self, py: Python<'_>, ptr: usize, count: usize, capacity: usize, dt: f32) {
+        if ptr == 0 || count == 0 {
+            return;
+        }
+        let base = ptr as *mut f32;
+        py.allow_threads(|| unsafe {
+            for field in 0..3 {
+                let pos = base.add(field * capacity);
+                let vel = base.add((field + 3) * capacity);
+                for i in 0..count {
+                    *pos.add(i) += *vel.add(i) * dt;
+                }
+            }
+        });
+    }
+}
+
+/// Lock-free slot arbitration for a frame-state triple buffer.
+///
+/// The Python update thread writes into the `write` slot and publishes;
+/// the render thread acquires the freshest published slot. Three slots
+/// mean the producer never stalls on the consumer. All transitions are
+/// single compare-exchange updates of one packed state byte:
+/// bits 0-1 read slot, bits 2-3 ready slot, bits 4-5 write slot,
+/// bit 6 "ready slot is fresh".
+#[pyclass]
+pub struct TripleBufferIndices {
+    state: AtomicU8,
+}
+
+const FRESH_BIT: u8 = 0x40;
+
+#[pymethods]
+impl TripleBufferIndices {
+    #[new]
+    fn new() -> Self {
+        // read = 0, ready = 1, write = 2, not fresh.
+        TripleBufferIndices {
+            state: AtomicU8::new(0b10_01_00),
+        }
+    }
+
+    /// Slot the producer should write into.
+    fn write_index(&self) -> u8 {
+        (self.state.load(Ordering::Acquire) >> 4) & 0b11
+    }
+
+    /// Publish the write slot; returns the new write slot.
+    fn publish(&self) -> u8 {
+        let mut next = 0;
+        self.state
+            .fetch_update(Ordering::AcqRel, Ordering::Acquire, |s| {
+                let read = s & 0b11;
+                let ready = (s >> 2) & 0b11;
+                let write = (s >> 4) & 0b11;
+                next = ready;
+                Some(FRESH_BIT | (ready << 4) | (write << 2) | read)
+            })
+            .unwrap();
+        next
+    }
+
+    /// Acquire the freshest published slot; returns (slot, was_fresh).
+    fn acquire(&self) -> (u8, bool) {
+        let mut slot = 0;
+        let mut fresh = false;
+        self.state
+            .fetch_update(Ordering::AcqRel, Ordering::Acquire, |s| {
+                if s & FRESH_BIT == 0 {
+                    slot = s & 0b11;
+                    fresh = false;
+                    return Some(s);
+                }
+                let read = s & 0b11;
+                let ready = (s >> 2) & 0b11;
+                slot = ready;
+                fresh = true;
+                Some((s & 0b110000) | (read << 2) | ready)
+            })
+            .unwrap();
+        (slot, fresh)
+    }
+}
+
+#[pymodule]
+fn windjammer_native(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<AppCore>()?;
+    m.add_class::<WorldCore>()?;
+    m.add_class::<TripleBufferIndices>()?;
+    Ok(())
+}
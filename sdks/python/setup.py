@@ -0,0 +1,98 @@
+"""Packaging for the Windjammer Python SDK.
+
+``python setup.py build_aot`` precompiles the Numba math kernels into a
+native ``windjammer_math`` module so installed wheels never pay Numba's
+JIT compile cost at game startup.
+"""
+
+import compileall
+import os
+import py_compile
+
+from setuptools import Command, setup
+from setuptools.command.install_lib import install_lib
+
+
+class InstallLib(install_lib):
+    """install_lib that byte-compiles the package at every optimize level.
+
+    Shipping .pyc next to the sources removes the parse/compile step
+    from cold starts (a few ms per CLI invocation). All three levels
+    are written because the interpreter only loads the .pyc matching
+    its own -O flags - an .opt-2-only install would still parse source
+    on a plain `python` run. checked-hash invalidation keeps the output
+    deterministic when SOURCE_DATE_EPOCH is set by the build.
+    """
+
+    def run(self):
+        super().run()
+        pkg_dir = os.path.join(self.install_dir, "windjammer_sdk")
+        if os.path.isdir(pkg_dir):
+            compileall.compile_dir(
+                pkg_dir,
+                optimize=[0, 1, 2],
+                quiet=1,
+                invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+            )
+
+
+class BuildAot(Command):
+    """Compile the AOT math kernels (requires numba)."""
+
+    description = "AOT-compile windjammer_sdk math kernels with numba.pycc"
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        from windjammer_sdk._math_aot import compile_aot
+
+        compile_aot()
+
+
+# The Cython math extension is optional: source installs without Cython
+# fall back to the pure-Python classes at import time. -O3 alone is the
+# distributable default; -march=native would bake the build host's ISA
+# into the binary and SIGILL on older CPUs, so it (plus fast-math,
+# which is safe here because the kernels already special-case zero) is
+# an explicit opt-in for from-source builds on the target machine:
+#
+#     WINDJAMMER_NATIVE_TUNE=1 pip install .
+_compile_args = ["-O3"]
+if os.environ.get("WINDJAMMER_NATIVE_TUNE"):
+    _compile_args += ["-march=native", "-ffast-math"]
+
+try:
+    from Cython.Build import cythonize
+    from setuptools import Extension
+
+    ext_modules = cythonize(
+        [
+            Extension(
+                "windjammer_sdk._math_ext",
+                ["windjammer_sdk/_math_ext.pyx"],
+                extra_compile_args=_compile_args,
+            )
+        ]
+    )
+except ImportError:
+    ext_modules = []
+
+
+setup(
+    name="windjammer-sdk",
+    version="0.48.0",
+    description="Windjammer game engine Python SDK",
+    packages=["windjammer_sdk"],
+    # Ship the AOT-compiled kernel module when build_aot produced one.
+    package_data={"windjammer_sdk": ["windjammer_math*.so", "windjammer_math*.pyd"]},
+    python_requires=">=3.9",
+    install_requires=["numpy>=1.24"],
+    extras_require={"jit": ["numba>=0.58"]},
+    cmdclass={"build_aot": BuildAot, "install_lib": InstallLib},
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,14 @@
+"""Test configuration for the Python SDK.
+
+Puts both the generated bindings and the `windjammer_sdk` package on
+`sys.path` so tests can import them without an install step.
+"""
+
+import sys
+from pathlib import Path
+
+SDK_ROOT = Path(__file__).resolve().parent.parent
+
+for _path in (str(SDK_ROOT), str(SDK_ROOT / "generated")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -0,0 +1,126 @@
+"""Tests for the App frame loop (generated bindings)."""
+
+from app import App, System
+
+
+def test_app_creation():
+    app = App()
+    assert app._systems == []
+    assert app._startup_systems == []
+    assert app._shutdown_systems == []
+    assert not app.running
+
+
+def test_add_system():
+    app = App()
+
+    def game_loop():
+        pass
+
+    app.add_system(game_loop)
+    assert game_loop in app._systems
+
+
+def test_add_systems_batch():
+    app = App()
+
+    def a():
+        pass
+
+    def b():
+        pass
+
+    app.add_systems([a, b])
+    assert app._systems == [a, b]
+
+
+def test_decorator_registration():
+    app = App()
+
+    @app.system
+    def update():
+        pass
+
+    @app.startup
+    def setup():
+        pass
+
+    @app.shutdown
+    def teardown():
+        pass
+
+    # @app.system wraps the function in a hotspot-tracking dispatcher.
+    assert [s.fn for s in app._systems] == [update]
+    assert setup in app._startup_systems
+    assert teardown in app._shutdown_systems
+
+
+def test_run_bounded_frames():
+    app = App(target_fps=0)
+    calls = {"startup": 0, "update": 0, "shutdown": 0}
+
+    app.add_startup_system(lambda: calls.__setitem__("startup", calls["startup"] + 1))
+    app.add_system(lambda: calls.__setitem__("update", calls["update"] + 1))
+    app.add_shutdown_system(lambda: calls.__setitem__("shutdown", calls["shutdown"] + 1))
+
+    app.run(max_frames=3)
+
+    assert calls == {"startup": 1, "update": 3, "shutdown": 1}
+    assert not app.running
+    # Frame timing is integer monotonic nanoseconds.
+    assert isinstance(app.frame_dt_ns, int)
+
+
+def test_system_subclass_auto_registers():
+    app = App(target_fps=0)
+    ticks = []
+
+    class Ticker(System):
+        def update(self):
+            ticks.append(1)
+
+    assert len(app._systems) == 1
+    app.run(max_frames=2)
+    assert len(ticks) == 2
+
+
+def test_system_subclass_can_opt_out():
+    app = App(target_fps=0)
+
+    class Abstract(System, register=False):
+        def update(self):
+            pass
+
+    assert app._systems == []
+
+
+def test_hot_system_counts_and_falls_back():
+    import app as app_module
+
+    counter = {"calls": 0}
+
+    def tick():
+        counter["calls"] += 1
+
+    hot = app_module._HotSystem(tick)
+    for _ in range(app_module._JIT_THRESHOLD + 5):
+        hot()
+
+    # Every invocation ran the system, with or without Numba available;
+    # closures over Python dicts are not JIT-able, so we stay interpreted.
+    assert counter["calls"] == app_module._JIT_THRESHOLD + 5
+    assert hot.compiled is None
+
+
+def test_quit_stops_loop():
+    app = App(target_fps=0)
+    frames = []
+
+    def update():
+        frames.append(1)
+        if len(frames) == 2:
+            app.quit()
+
+    app.add_system(update)
+    app.run()
+    assert len(frames) == 2
@@ -0,0 +1,77 @@
+"""Tests for windjammer_sdk.audio and windjammer_sdk.ai."""
+
+import logging
+
+from windjammer_sdk.ai import Pathfinder
+from windjammer_sdk.audio import AudioSource
+
+
+def test_audio_source_play_stop_logs_at_debug(caplog):
+    source = AudioSource("jump.ogg")
+    with caplog.at_level(logging.DEBUG, logger="windjammer"):
+        source.play()
+        assert source.playing
+        source.stop()
+        assert not source.playing
+    assert "jump.ogg" in caplog.text
+
+
+def test_audio_is_silent_at_default_level(caplog):
+    with caplog.at_level(logging.WARNING, logger="windjammer"):
+        AudioSource("shot.ogg").play()
+    assert caplog.text == ""
+
+
+def test_pathfinder_returns_endpoints():
+    path = Pathfinder().find_path((0, 0), (3, 4))
+    assert path == [(0, 0), (3, 4)]
+
+
+def test_astar_routes_around_walls():
+    import numpy as np
+
+    grid = np.zeros((5, 5), dtype=np.int8)
+    grid[1:5, 2] = 1  # vertical wall with a gap at the top row
+    finder = Pathfinder(grid)
+    path = finder.find_path((0, 4), (4, 4))
+    assert path.dtype == np.float32
+    assert tuple(path[0]) == (0.0, 4.0)
+    assert tuple(path[-1]) == (4.0, 4.0)
+    # Consecutive cells are 4-connected and never inside the wall.
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        assert abs(x1 - x0) + abs(y1 - y0) == 1.0
+        assert grid[int(y1), int(x1)] == 0
+    # Must detour through the gap at y=0.
+    assert path[:, 1].min() == 0.0
+    assert finder.path is path
+
+
+def test_astar_reports_unreachable_goal():
+    import numpy as np
+
+    grid = np.zeros((3, 3), dtype=np.int8)
+    grid[:, 1] = 1  # full wall
+    path = Pathfinder(grid).find_path((0, 0), (2, 2))
+    assert path.shape == (0, 2)
+
+
+def test_audio_positions_live_in_shared_soa_block():
+    import numpy as np
+
+    from windjammer_sdk.audio import AudioWorld
+    from windjammer_sdk.math import Vec3
+
+    world = AudioWorld(capacity=1)
+    a = AudioSource("a.ogg", world=world)
+    b = AudioSource("b.ogg", world=world)  # forces a grow
+    a.position = Vec3(1.0, 2.0, 3.0)
+    b.position = (4.0, 0.0, 0.0)
+    assert world.positions.shape == (2, 3)
+    assert np.allclose(a.position, [1.0, 2.0, 3.0])
+    # position is a view into the block, not a copy.
+    world.positions[0, 0] = 9.0
+    assert a.position[0] == 9.0
+
+    gains = world.compute_gains((0.0, 0.0, 0.0))
+    assert gains.shape == (2,)
+    assert gains[1] == 1.0 / 17.0
@@ -0,0 +1,49 @@
+"""Tests for generated 2D component classes and their slotted layout."""
+
+import pytest
+
+from camera2d import Camera2D
+from color import Color
+from mesh import Mesh
+from rigidbody2d import RigidBody2D
+from rigidbodytype import RigidBodyType
+from sprite import Sprite
+from transform2d import Transform2D
+from vec2 import make_vec2
+
+
+def test_component_classes_have_no_instance_dict():
+    instances = [
+        Color(),
+        Sprite("assets/player.png"),
+        Mesh.cube(),
+        Camera2D(),
+        RigidBody2D(),
+        Transform2D(),
+    ]
+    for obj in instances:
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+        with pytest.raises(AttributeError):
+            obj.not_a_field = 1
+
+
+def test_transform2d_defaults():
+    t = Transform2D()
+    assert (t.position.x, t.position.y) == (0.0, 0.0)
+    assert t.rotation == 0.0
+    assert (t.scale.x, t.scale.y) == (1.0, 1.0)
+
+
+def test_rigidbody_accumulates_and_drains():
+    body = RigidBody2D(RigidBodyType.Dynamic)
+    body.apply_force(make_vec2(-10.0, 0.0))
+    body.apply_force(make_vec2(-10.0, 0.0))
+    body.apply_impulse(make_vec2(0.0, 15.0))
+    assert body.drain_accumulators() == (-20.0, 0.0, 0.0, 15.0)
+    assert body.drain_accumulators() == (0.0, 0.0, 0.0, 0.0)
+
+
+def test_camera_follow():
+    cam = Camera2D()
+    cam.follow(make_vec2(3.0, 4.0))
+    assert (cam.position.x, cam.position.y) == (3.0, 4.0)
@@ -0,0 +1,122 @@
+"""Tests for the FFI layer (windjammer_sdk.ffi / ffi_math)."""
+
+import ctypes
+
+import numpy as np
+import pytest
+
+from windjammer_sdk.ffi import Vec3Array, WjColor, WjVec2, WjVec3
+from windjammer_sdk.ffi_math import Color, Vec3
+
+
+def test_struct_layouts():
+    assert ctypes.sizeof(WjVec2) == 8
+    assert ctypes.sizeof(WjVec3) == 12
+    assert ctypes.sizeof(WjColor) == 16
+    v = WjVec3(1.0, 2.0, 3.0)
+    assert (v.x, v.y, v.z) == (1.0, 2.0, 3.0)
+
+
+def test_ffi_vec3_math_without_library():
+    v1 = Vec3(1.0, 2.0, 3.0)
+    v2 = Vec3(4.0, 5.0, 6.0)
+    assert v1 + v2 == Vec3(5.0, 7.0, 9.0)
+    assert v1.dot(v2) == pytest.approx(32.0)
+    n = Vec3(3.0, 0.0, 4.0).normalize()
+    assert n.x == pytest.approx(0.6)
+    assert n.z == pytest.approx(0.8)
+    assert Color(1.0, 0.0, 0.0, 1.0) == Color(1.0, 0.0, 0.0, 1.0)
+
+
+def test_ffi_vec3_syncs_handle_lazily():
+    v = Vec3(1.0, 2.0, 3.0)
+    assert v._handle is None  # no struct until the value crosses into C
+    handle = v._sync_to_handle()
+    assert (handle.x, handle.y, handle.z) == (1.0, 2.0, 3.0)
+    v.x = 9.0
+    assert v._handle.x == 1.0  # stale until the next boundary sync
+    assert v._sync_to_handle() is handle
+    assert v._handle.x == 9.0
+
+
+def test_vec3array_planar_layout():
+    batch = Vec3Array.from_vectors([Vec3(1, 2, 3), Vec3(4, 5, 6)])
+    assert len(batch) == 2
+    assert np.allclose(batch.x, [1.0, 4.0])
+    assert np.allclose(batch.z, [3.0, 6.0])
+    # One contiguous block: x plane first, then y, then z.
+    flat = batch._data.ravel()
+    assert batch._data.flags["C_CONTIGUOUS"]
+    assert np.allclose(flat, [1, 4, 2, 5, 3, 6])
+
+
+def test_vec3array_buffer_ptr_reads_first_plane():
+    batch = Vec3Array.from_vectors([Vec3(7, 8, 9)])
+    ptr = batch.buffer_ptr()
+    assert ptr[0] == pytest.approx(7.0)
+
+
+def test_vec3array_normalize_inplace():
+    batch = Vec3Array.from_vectors([Vec3(3, 0, 4), Vec3(0, 0, 0)])
+    assert batch.normalize_() is batch
+    assert np.allclose(batch.x, [0.6, 0.0])
+    assert np.allclose(batch.z, [0.8, 0.0])
+    lengths = np.sqrt(batch.x**2 + batch.y**2 + batch.z**2)
+    assert np.allclose(lengths, [1.0, 0.0])
+
+
+def test_vec3array_bulk_ops():
+    a = Vec3Array.from_vectors([Vec3(1, 2, 3), Vec3(4, 5, 6)])
+    b = Vec3Array.from_vectors([Vec3(7, 8, 9), Vec3(1, 0, 0)])
+    c = a.add(b)
+    assert np.allclose(c.x, [8.0, 5.0])
+    assert np.allclose(a.dot(b), [50.0, 4.0])
+    out = np.empty(2, dtype=np.float32)
+    assert a.dot(b, out=out) is out
+    assert np.allclose(out, [50.0, 4.0])
+
+
+def test_batch_new_builds_handles_in_one_block():
+    arr = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.float32)
+    vectors = Vec3.batch_new(arr)
+    assert [v.x for v in vectors] == [1.0, 4.0, 7.0]
+    assert vectors[2] == Vec3(7.0, 8.0, 9.0)
+    # Handles are pre-populated views into one contiguous struct block.
+    assert vectors[1]._handle.y == 5.0
+    addr0 = ctypes.addressof(vectors[0]._handle)
+    addr1 = ctypes.addressof(vectors[1]._handle)
+    assert addr1 - addr0 == ctypes.sizeof(WjVec3)
+
+
+def test_to_bytes_is_packed_c_floats():
+    import struct
+
+    v = Vec3(1.0, 2.0, 3.0)
+    assert struct.unpack("3f", v.to_bytes()) == (1.0, 2.0, 3.0)
+    c = Color(0.5, 0.25, 0.0, 1.0)
+    assert struct.unpack("4f", c.to_bytes()) == (0.5, 0.25, 0.0, 1.0)
+
+
+def test_instances_pass_directly_to_ctypes_calls():
+    # A CFUNCTYPE taking WjVec3 accepts Vec3 via _as_parameter_.
+    proto = ctypes.CFUNCTYPE(ctypes.c_float, WjVec3)
+    native_sum = proto(lambda v: v.x + v.y + v.z)
+    assert native_sum(Vec3(1.0, 2.0, 3.0)) == pytest.approx(6.0)
+    proto4 = ctypes.CFUNCTYPE(ctypes.c_float, WjColor)
+    assert proto4(lambda c: c.r + c.a)(Color(0.25, 0.0, 0.0, 1.0)) == pytest.approx(1.25)
+
+
+def test_ffi_types_hash_like_their_component_tuples():
+    assert hash(Vec3(1.0, 2.0, 3.0)) == hash((1.0, 2.0, 3.0))
+    assert hash(Color(0.5, 0.5, 0.5, 1.0)) == hash((0.5, 0.5, 0.5, 1.0))
+    assert len({Vec3(1.0, 2.0, 3.0), Vec3(1.0, 2.0, 3.0)}) == 1
+
+
+def test_bind_tolerates_missing_symbols(monkeypatch):
+    from windjammer_sdk import ffi
+
+    class _PartialLib:
+        """A loaded library that exports none of the wj_* symbols."""
+
+    monkeypatch.setattr(ffi, "_lib", _PartialLib())
+    assert ffi._bind("wj_vec3_dot", [], None) is None
@@ -0,0 +1,36 @@
+"""Tests for lazy exports in windjammer_sdk.__init__."""
+
+import sys
+
+import pytest
+
+
+def test_lazy_import_defers_submodules():
+    # Snapshot and restore so other tests keep their class identities.
+    saved = {
+        name: sys.modules.pop(name)
+        for name in list(sys.modules)
+        if name.startswith("windjammer_sdk")
+    }
+    try:
+        import windjammer_sdk
+
+        assert "windjammer_sdk.ffi" not in sys.modules
+        assert windjammer_sdk.Vec3(1, 2, 3).x == 1.0
+        assert "windjammer_sdk.math" in sys.modules
+        assert "windjammer_sdk.ffi" not in sys.modules
+        assert windjammer_sdk.Vec3Array(2)
+        assert "windjammer_sdk.ffi" in sys.modules
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("windjammer_sdk"):
+                del sys.modules[name]
+        sys.modules.update(saved)
+
+
+def test_unknown_attribute_raises():
+    import windjammer_sdk
+
+    with pytest.raises(AttributeError):
+        windjammer_sdk.NoSuchThing
+    assert "Vec3" in dir(windjammer_sdk)
@@ -0,0 +1,52 @@
+"""Tests for bitset-backed input state (generated bindings)."""
+
+from input import Input
+from key import Key
+
+
+def test_key_codes_are_dense_ints():
+    assert Key.A == 0
+    assert int(Key.Space) == 36
+    assert all(int(k) < 64 for k in Key)
+
+
+def test_press_sets_held_and_pressed():
+    inp = Input()
+    inp.press_key(Key.A)
+    assert inp.is_key_held(Key.A)
+    assert inp.is_key_pressed(Key.A)
+    assert not inp.is_key_held(Key.D)
+
+
+def test_pressed_is_edge_triggered():
+    inp = Input()
+    inp.press_key(Key.Space)
+    assert inp.is_key_pressed(Key.Space)
+    inp.end_frame()
+    # Still held, but no longer "pressed this frame".
+    assert inp.is_key_held(Key.Space)
+    assert not inp.is_key_pressed(Key.Space)
+    # Repeats while held don't re-trigger the edge.
+    inp.press_key(Key.Space)
+    assert not inp.is_key_pressed(Key.Space)
+
+
+def test_release_clears_held_and_sets_released():
+    inp = Input()
+    inp.press_key(Key.W)
+    inp.end_frame()
+    inp.release_key(Key.W)
+    assert not inp.is_key_held(Key.W)
+    assert inp.is_key_released(Key.W)
+    inp.end_frame()
+    assert not inp.is_key_released(Key.W)
+
+
+def test_update_from_native_replaces_state():
+    inp = Input()
+    held = (1 << Key.A) | (1 << Key.D)
+    inp.update_from_native(held, 1 << Key.A, 0)
+    assert inp.is_key_held(Key.A)
+    assert inp.is_key_held(Key.D)
+    assert inp.is_key_pressed(Key.A)
+    assert not inp.is_key_pressed(Key.D)
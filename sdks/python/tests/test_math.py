@@ -0,0 +1,285 @@
+"""Tests for the pure-Python math types (windjammer_sdk.math)."""
+
+import pytest
+
+from windjammer_sdk.math import Color, Quat, Vec2, Vec3, Vec4
+
+
+def test_vec3_construction_and_defaults():
+    v = Vec3(1, 2, 3)
+    assert (v.x, v.y, v.z) == (1.0, 2.0, 3.0)
+    assert Vec3() == Vec3(0.0, 0.0, 0.0)
+
+
+def test_vec3_arithmetic():
+    v1 = Vec3(1.0, 2.0, 3.0)
+    v2 = Vec3(4.0, 5.0, 6.0)
+    v3 = v1 + v2
+    assert v3 == Vec3(5.0, 7.0, 9.0)
+    assert v2 - v1 == Vec3(3.0, 3.0, 3.0)
+    assert v1 * 2.0 == Vec3(2.0, 4.0, 6.0)
+    assert 2.0 * v1 == Vec3(2.0, 4.0, 6.0)
+
+
+def test_vec3_dot_and_cross():
+    v1 = Vec3(1.0, 2.0, 3.0)
+    v2 = Vec3(4.0, 5.0, 6.0)
+    assert v1.dot(v2) == pytest.approx(32.0)
+    assert Vec3(1, 0, 0).cross(Vec3(0, 1, 0)) == Vec3(0, 0, 1)
+
+
+def test_normalize():
+    v = Vec3(3.0, 0.0, 4.0)
+    n = v.normalize()
+    assert n.length() == pytest.approx(1.0)
+    # approx: normalize uses the reciprocal-multiply form, which can
+    # differ from an exact division by 1 ulp.
+    assert n.x == pytest.approx(0.6)
+    assert n.z == pytest.approx(0.8)
+    assert Vec3.zero().normalize() == Vec3.zero()
+
+    v2 = Vec2(3.0, 4.0)
+    assert v2.length() == pytest.approx(5.0)
+    n2 = v2.normalize()
+    assert n2.x == pytest.approx(0.6)
+    assert n2.y == pytest.approx(0.8)
+
+
+def test_equality():
+    assert Vec2(1.0, 2.0) == Vec2(1.0, 2.0)
+    assert Vec2(1.0, 2.0) != Vec2(2.0, 1.0)
+    assert Vec4(1, 2, 3, 4) == Vec4(1, 2, 3, 4)
+    assert Vec3(1, 2, 3) != "not a vector"
+
+
+def test_constants():
+    assert Vec3.zero() == Vec3(0.0, 0.0, 0.0)
+    assert Vec3.one() == Vec3(1.0, 1.0, 1.0)
+    assert Vec3.up() == Vec3(0.0, 1.0, 0.0)
+    assert Vec2.zero() == Vec2(0.0, 0.0)
+
+
+def test_quat_identity():
+    q = Quat.identity()
+    assert (q.x, q.y, q.z, q.w) == (0.0, 0.0, 0.0, 1.0)
+
+
+def test_predefined_colors():
+    assert Color.white() == Color(1.0, 1.0, 1.0, 1.0)
+    assert Color.black() == Color(0.0, 0.0, 0.0, 1.0)
+    assert Color.red() == Color(1.0, 0.0, 0.0, 1.0)
+    assert Color.green() == Color(0.0, 1.0, 0.0, 1.0)
+    assert Color.blue() == Color(0.0, 0.0, 1.0, 1.0)
+    assert Color.transparent().a == 0.0
+
+
+def test_predefined_colors_are_shared_and_immutable():
+    assert Color.white() is Color.white()
+    assert Color.red() is Color.red()
+    with pytest.raises(AttributeError):
+        Color.white().r = 0.5
+
+
+def test_batched_vec3_ops():
+    import numpy as np
+
+    from windjammer_sdk.math import (
+        vec3_add,
+        vec3_cross,
+        vec3_dot,
+        vec3_normalize,
+    )
+
+    a = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.float32)
+    b = np.array([[7, 8, 9], [1, 0, 0]], dtype=np.float32)
+
+    assert np.allclose(vec3_add(a, b), [[8, 10, 12], [5, 5, 6]])
+    assert np.allclose(vec3_dot(a, b), [50.0, 4.0])
+    assert np.allclose(vec3_cross(a, b)[1], [0.0, 6.0, -5.0])
+
+    normalized = vec3_normalize(np.array([[3, 0, 4], [0, 0, 0]], np.float32))
+    assert np.allclose(normalized[0], [0.6, 0.0, 0.8])
+    assert np.allclose(normalized[1], 0.0)
+
+
+def test_vec3_numpy_round_trip():
+    import numpy as np
+
+    vectors = [Vec3(1, 2, 3), Vec3(4, 5, 6)]
+    arr = Vec3.to_numpy(vectors)
+    assert arr.dtype == np.float32
+    assert arr.shape == (2, 3)
+    assert Vec3.from_numpy(arr) == vectors
+
+
+def test_aot_kernels_fall_back_without_numba():
+    import numpy as np
+
+    from windjammer_sdk._math_aot import load_kernels
+
+    kernels = load_kernels()
+    a = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    b = np.array([4.0, 5.0, 6.0], dtype=np.float32)
+    assert kernels.vec3_dot(a, b) == pytest.approx(32.0)
+    assert np.allclose(kernels.vec3_add(a, b), [5.0, 7.0, 9.0])
+    n = kernels.vec3_normalize(np.array([3.0, 0.0, 4.0], dtype=np.float32))
+    assert np.allclose(n, [0.6, 0.0, 0.8])
+
+
+def test_math_types_are_slotted_and_hashable():
+    v = Vec3(1.0, 2.0, 3.0)
+    assert not hasattr(v, "__dict__")
+    assert hash(v) == hash(Vec3(1.0, 2.0, 3.0))
+    assert hash(Vec2(1.0, 2.0)) == hash(Vec2(1.0, 2.0))
+    assert len({Color.white(), Color(1.0, 1.0, 1.0, 1.0)}) == 1
+
+
+def test_inplace_operators_mutate_without_reallocating():
+    v = Vec3(1.0, 2.0, 3.0)
+    original = v
+    v += Vec3(1.0, 1.0, 1.0)
+    v -= Vec3(0.0, 1.0, 0.0)
+    v *= 2.0
+    assert v is original
+    assert v == Vec3(4.0, 4.0, 8.0)
+
+    u = Vec2(1.0, 1.0)
+    u += Vec2(2.0, 3.0)
+    u *= 0.5
+    assert u == Vec2(1.5, 2.0)
+
+
+def test_vec3_batch_ops_and_views():
+    import numpy as np
+
+    from windjammer_sdk.math import Vec3Batch
+
+    a = Vec3Batch.from_vectors([Vec3(1, 2, 3), Vec3(4, 5, 6)])
+    b = Vec3Batch.from_vectors([Vec3(7, 8, 9), Vec3(1, 0, 0)])
+    assert len(a) == 2
+    assert np.allclose((a + b).x, [8.0, 5.0])
+    assert np.allclose((b - a).y, [6.0, -5.0])
+    assert np.allclose((a * 2.0).z, [6.0, 12.0])
+    assert np.allclose(a.dot(b), [50.0, 4.0])
+    assert np.allclose(a.cross(b)._data[1], [0.0, 6.0, -5.0])
+    # Column views write through to the shared block.
+    a.x[:] = 0.0
+    assert np.allclose(a._data[:, 0], 0.0)
+    assert Vec3.from_batch(b, 1) == Vec3(1.0, 0.0, 0.0)
+
+
+def test_vec3_batch_normalize_in_place():
+    import numpy as np
+
+    from windjammer_sdk.math import Vec3Batch
+
+    batch = Vec3Batch.from_vectors([Vec3(3, 0, 4), Vec3.zero()])
+    assert batch.normalize_() is batch
+    assert np.allclose(batch.lengths(), [1.0, 0.0])
+    assert np.allclose(batch._data[0], [0.6, 0.0, 0.8])
+
+
+def test_math_kernels_match_reference():
+    import numpy as np
+
+    from windjammer_sdk import _math_kernels as mk
+
+    assert mk._dot3(1.0, 2.0, 3.0, 4.0, 5.0, 6.0) == pytest.approx(32.0)
+    assert mk._cross3(1.0, 0.0, 0.0, 0.0, 1.0, 0.0) == (0.0, 0.0, 1.0)
+    assert mk._length3(3.0, 0.0, 4.0) == pytest.approx(5.0)
+    assert mk._normalize3(0.0, 0.0, 0.0) == (0.0, 0.0, 0.0)
+
+    a = np.array([[1, 2, 3], [3, 0, 4]], dtype=np.float32)
+    b = np.array([[4, 5, 6], [1, 0, 0]], dtype=np.float32)
+    out = np.empty(2, dtype=np.float32)
+    mk.dot3_batch(a, b, out)
+    assert np.allclose(out, [32.0, 3.0])
+    out3 = np.empty((2, 3), dtype=np.float32)
+    mk.cross3_batch(a, b, out3)
+    assert np.allclose(out3[0], [-3.0, 6.0, -3.0])
+    mk.normalize3_batch(a)
+    assert np.allclose(a[1], [0.6, 0.0, 0.8])
+
+
+def test_vector_constants_are_shared_and_immutable():
+    assert Vec3.zero() is Vec3.zero()
+    assert Vec3.up() is Vec3.up()
+    assert Vec2.one() is Vec2.one()
+    with pytest.raises(AttributeError):
+        Vec3.zero().x = 1.0
+    with pytest.raises(AttributeError):
+        Vec3.zero().__iadd__(Vec3.one())
+    # Still compares equal to a fresh instance.
+    assert Vec3.zero() == Vec3(0.0, 0.0, 0.0)
+
+
+def test_normalize_guards_near_zero_vectors():
+    tiny = Vec3(1e-12, 0.0, 0.0).normalize()
+    assert tiny == Vec3.zero()
+    assert Vec2(0.0, 1e-12).normalize() == Vec2(0.0, 0.0)
+
+
+def test_vec3_batch_dot_batch_matches_dot():
+    import numpy as np
+
+    from windjammer_sdk.math import Vec3Batch
+
+    a = Vec3Batch.from_vectors([Vec3(1, 2, 3), Vec3(4, 5, 6)])
+    b = Vec3Batch.from_vectors([Vec3(7, 8, 9), Vec3(1, 0, 0)])
+    assert np.allclose(a.dot_batch(b), a.dot(b))
+
+
+def test_color8_round_trip_and_packing():
+    from windjammer_sdk.math import Color8
+
+    c8 = Color.red().to_color8()
+    assert (c8.r, c8.g, c8.b, c8.a) == (255, 0, 0, 255)
+    assert c8.packed == 0xFF0000FF
+    assert c8 == Color8(255, 0, 0)
+    assert Color8.from_packed(c8.packed) == c8
+    assert c8.to_color() == Color(1.0, 0.0, 0.0, 1.0)
+    # Out-of-range floats clamp rather than wrap.
+    assert Color(2.0, -1.0, 0.5, 1.0).to_color8().r == 255
+
+
+def test_quat_to_matrix_batch():
+    import math as pymath
+
+    import numpy as np
+
+    from windjammer_sdk.math import mat4_multiply_batch
+
+    half = pymath.pi / 4.0  # 90 degrees about each axis
+    quats = np.array(
+        [
+            [0.0, 0.0, 0.0, 1.0],
+            [pymath.sin(half), 0.0, 0.0, pymath.cos(half)],
+            [0.0, 0.0, pymath.sin(half), pymath.cos(half)],
+        ],
+        dtype=np.float32,
+    )
+    m = Quat.to_matrix_batch(quats)
+    assert m.shape == (3, 4, 4)
+    assert np.allclose(m[0], np.eye(4), atol=1e-6)
+    # 90 deg about X maps +Y to +Z; about Z maps +X to +Y.
+    assert np.allclose(m[1, :3, :3] @ [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], atol=1e-6)
+    assert np.allclose(m[2, :3, :3] @ [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], atol=1e-6)
+    # out= reuses the caller's buffer; hierarchy multiply composes.
+    buf = np.empty_like(m)
+    assert Quat.to_matrix_batch(quats, out=buf) is buf
+    composed = mat4_multiply_batch(m, m)
+    assert np.allclose(composed[1], m[1] @ m[1], atol=1e-6)
+
+
+def test_add_scaled_fuses_integration_step():
+    pos = Vec3(1.0, 2.0, 3.0)
+    vel = Vec3(10.0, 0.0, -10.0)
+    assert pos.add_scaled(vel, 0.5) == Vec3(6.0, 2.0, -2.0)
+    # Original is untouched by the allocating form.
+    assert pos == Vec3(1.0, 2.0, 3.0)
+    # In-place form mutates and returns self.
+    assert pos.add_scaled_(vel, 0.5) is pos
+    assert pos == Vec3(6.0, 2.0, -2.0)
+    # Frozen singletons refuse in-place mutation.
+    with pytest.raises(AttributeError):
+        Vec3.zero().add_scaled_(vel, 1.0)
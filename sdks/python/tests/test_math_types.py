@@ -0,0 +1,73 @@
+"""Tests for the generated math value types (Vec2/Vec3/Color)."""
+
+import numpy as np
+import pytest
+
+from color import Color
+from vec2 import Vec2, make_vec2, make_vec2_array
+from vec3 import Vec3, make_vec3, make_vec3_array
+
+
+def test_make_vec2_fields():
+    v = make_vec2(-10.0, 2.5)
+    assert v.x == pytest.approx(-10.0)
+    assert v.y == pytest.approx(2.5)
+    assert v.nbytes == 8
+
+
+def test_make_vec3_fields():
+    v = make_vec3(1.0, 2.0, 3.0)
+    assert (v.x, v.y, v.z) == pytest.approx((1.0, 2.0, 3.0))
+    assert v.nbytes == 12
+
+
+def test_vec_defaults_are_zero():
+    assert make_vec2().x == 0.0
+    v = make_vec3()
+    assert (v.x, v.y, v.z) == (0.0, 0.0, 0.0)
+
+
+def test_vec_arrays_are_contiguous_and_ffi_ready():
+    arr = make_vec2_array(16)
+    assert arr.dtype == Vec2
+    assert arr.flags["C_CONTIGUOUS"]
+    arr["x"][:] = 1.0
+    assert arr[0]["x"] == 1.0
+
+    arr3 = make_vec3_array(4)
+    assert arr3.dtype == Vec3
+    assert arr3.ctypes.data != 0
+
+
+def test_color_packs_to_u8_rgba():
+    assert Color(1.0, 1.0, 1.0, 1.0).to_u8_rgba() == 0xFFFFFFFF
+    assert Color(1.0, 0.0, 0.0, 1.0).to_u8_rgba() == 0xFF0000FF
+    assert Color(0.0, 0.0, 0.0, 0.0).to_u8_rgba() == 0x00000000
+    # r sits in the low byte (little-endian memory order R,G,B,A),
+    # matching windjammer_sdk.math.Color8.
+    assert Color(0.0, 1.0, 0.0, 0.0).to_u8_rgba() == 0x0000FF00
+    # HDR values clamp instead of overflowing into other channels.
+    assert Color(2.0, 0.0, 0.0, 1.0).to_u8_rgba() == 0xFF0000FF
+
+
+def test_sprite_vertex_layout_is_20_bytes():
+    from sprite import VERTEX_DTYPE, Sprite
+    from renderqueue import RenderQueue
+
+    assert VERTEX_DTYPE.itemsize == 20
+
+    queue = RenderQueue()
+    sprite = Sprite("assets/player.png")
+    sprite.color = Color(1.0, 0.0, 0.0, 1.0)
+    sprite.draw(queue)
+    batch = queue.flush()[0]
+    assert batch.vertices.dtype == VERTEX_DTYPE
+    assert int(batch.vertices["color"][0]) == 0xFF0000FF
+
+
+def test_color_channels_and_equality():
+    c = Color(1.0, 0.5, 0.25, 1.0)
+    assert (c.r, c.g, c.b, c.a) == (1.0, 0.5, 0.25, 1.0)
+    assert c == Color(1.0, 0.5, 0.25, 1.0)
+    assert c != Color(0.0, 0.5, 0.25, 1.0)
+    assert Color() == Color(1.0, 1.0, 1.0, 1.0)
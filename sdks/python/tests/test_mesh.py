@@ -0,0 +1,90 @@
+"""Tests for mesh primitive generation (generated bindings)."""
+
+import numpy as np
+import pytest
+
+from mesh import Mesh
+
+
+def test_sphere_buffers_shape_and_layout():
+    buffers = Mesh.sphere(radius=2.0, subdivisions=8).generate()
+    assert len(buffers) == 81
+    assert buffers.pos_x.dtype == np.float32
+    assert buffers.pos_x.flags["C_CONTIGUOUS"]
+
+
+def test_sphere_normals_are_unit_and_positions_scaled():
+    buffers = Mesh.sphere(radius=2.0, subdivisions=16).generate()
+    norms = np.sqrt(buffers.norm_x**2 + buffers.norm_y**2 + buffers.norm_z**2)
+    assert np.allclose(norms, 1.0, atol=1e-5)
+    radii = np.sqrt(buffers.pos_x**2 + buffers.pos_y**2 + buffers.pos_z**2)
+    assert np.allclose(radii, 2.0, atol=1e-4)
+
+
+def test_sphere_uvs_cover_unit_square():
+    buffers = Mesh.sphere(subdivisions=4).generate()
+    for stream in (buffers.uv_u, buffers.uv_v):
+        assert stream.min() == pytest.approx(0.0)
+        assert stream.max() == pytest.approx(1.0)
+
+
+def test_cube_buffers():
+    buffers = Mesh.cube(size=2.0).generate()
+    assert len(buffers) == 24
+    # Every vertex sits on the surface of the +-1 cube.
+    max_axis = np.maximum.reduce(
+        [np.abs(buffers.pos_x), np.abs(buffers.pos_y), np.abs(buffers.pos_z)]
+    )
+    assert np.allclose(max_axis, 1.0)
+    norms = np.sqrt(buffers.norm_x**2 + buffers.norm_y**2 + buffers.norm_z**2)
+    assert np.allclose(norms, 1.0)
+
+
+def test_plane_buffers():
+    buffers = Mesh.plane(size=10.0).generate()
+    assert len(buffers) == 4
+    assert np.allclose(buffers.norm_y, 1.0)
+    assert np.allclose(buffers.pos_y, 0.0)
+    assert np.abs(buffers.pos_x).max() == pytest.approx(5.0)
+
+
+def test_sphere_tiles_stream_all_vertices():
+    from mesh import _STAGING, sphere_vertex_tiles
+
+    subdivisions = 8
+    total = 0
+    last_offset = -1
+    for offset, block in sphere_vertex_tiles(radius=2.0, subdivisions=subdivisions):
+        assert offset > last_offset
+        last_offset = offset
+        # Every tile is a view into the shared staging buffer.
+        assert block.base is _STAGING
+        assert len(block) <= 64
+        # Positions sit on the sphere, normals are unit length.
+        radii = np.sqrt((block[:, 0:3] ** 2).sum(axis=1))
+        assert np.allclose(radii, 2.0, atol=1e-4)
+        norms = np.sqrt((block[:, 3:6] ** 2).sum(axis=1))
+        assert np.allclose(norms, 1.0, atol=1e-5)
+        total += len(block)
+    assert total == (subdivisions + 1) ** 2
+
+
+def test_primitive_factories_memoize_without_cache_poisoning():
+    from mesh import _cube_template
+
+    # Positional and keyword call styles hit one template cache entry.
+    assert _cube_template.cache_clear() is None
+    first = Mesh.cube(2.0)
+    second = Mesh.cube(size=2.0)
+    assert _cube_template.cache_info().currsize == 1
+    # Callers get private copies: mutating one can't leak into later calls.
+    assert first is not second
+    first.material_id = 7
+    assert Mesh.cube(size=2.0).material_id == 0
+    assert Mesh.sphere(radius=1.0, subdivisions=8).radius == 1.0
+    assert Mesh.plane().size == 10.0
+
+
+def test_unknown_mesh_type_raises():
+    with pytest.raises(ValueError):
+        Mesh("torus").generate()
@@ -0,0 +1,44 @@
+"""Tests for the packed light uniform buffer."""
+
+import numpy as np
+import pytest
+
+from color import Color
+from pointlight import LightBuffer, PointLight
+from vec3 import make_vec3
+
+
+def test_lights_pack_into_rows():
+    buf = LightBuffer(capacity=4)
+    light = PointLight(
+        position=make_vec3(1.0, 2.0, 3.0),
+        color=Color(0.5, 0.25, 0.125, 1.0),
+        intensity=2.0,
+        buffer=buf,
+    )
+    row = buf.row(light._index)
+    assert np.allclose(row, [1.0, 2.0, 3.0, 2.0, 0.5, 0.25, 0.125, 1.0])
+
+
+def test_position_view_writes_through():
+    buf = LightBuffer(capacity=2)
+    light = PointLight(buffer=buf)
+    light.position[:] = [4.0, 5.0, 6.0]
+    assert np.allclose(buf.row(light._index)[0:3], [4.0, 5.0, 6.0])
+    assert light.intensity == 1.0
+
+
+def test_ffi_args_cover_allocated_lights():
+    buf = LightBuffer(capacity=8)
+    PointLight(buffer=buf)
+    PointLight(buffer=buf)
+    ptr, count = buf.ffi_args()
+    assert ptr == buf._buf.ctypes.data
+    assert count == 2
+
+
+def test_capacity_exhausted():
+    buf = LightBuffer(capacity=1)
+    PointLight(buffer=buf)
+    with pytest.raises(IndexError):
+        PointLight(buffer=buf)
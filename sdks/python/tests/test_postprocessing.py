@@ -0,0 +1,79 @@
+"""Tests for the post-processing chain and async compositor."""
+
+import numpy as np
+import pytest
+
+from postprocessing import AsyncCompositor, PostProcessing
+
+
+def _full_chain():
+    post = PostProcessing()
+    post.set_hdr(enabled=True, exposure=2.0)
+    post.set_bloom(intensity=0.5, threshold=1.0)
+    post.set_ssao(radius=0.5, samples=16)
+    post.set_tone_mapping(mode="aces")
+    post.set_color_grading(saturation=1.0, contrast=1.0)
+    return post
+
+
+def test_passes_compile_in_chain_order():
+    post = PostProcessing()
+    post.set_tone_mapping()
+    post.set_hdr()
+    post.set_bloom()
+    names = [name for name, _ in post.compiled_passes()]
+    assert names == ["hdr", "bloom", "tone_mapping"]
+
+
+def test_passes_route_to_queues():
+    post = _full_chain()
+    compute = [name for name, _ in post.passes_for_queue("compute")]
+    graphics = [name for name, _ in post.passes_for_queue("graphics")]
+    assert compute == ["bloom", "ssao"]
+    assert graphics == ["hdr", "tone_mapping", "color_grading"]
+    # Every configured pass lands on exactly one queue.
+    assert len(compute) + len(graphics) == len(post.compiled_passes())
+
+
+def test_compositor_one_frame_latency():
+    compositor = AsyncCompositor(_full_chain())
+    frame0 = np.full((4, 4), 0.25, dtype=np.float32)
+    frame1 = np.full((4, 4), 0.5, dtype=np.float32)
+
+    assert compositor.submit(frame0) is None
+    result0 = compositor.submit(frame1)
+    result1 = compositor.drain()
+
+    # frame0 came back on the second submit, frame1 on drain.
+    expected0 = (0.25 * 2.0) / (1.0 + 0.25 * 2.0)
+    expected1 = (0.5 * 2.0) / (1.0 + 0.5 * 2.0)
+    assert result0 == pytest.approx(np.full((4, 4), expected0), rel=1e-5)
+    assert result1 == pytest.approx(np.full((4, 4), expected1), rel=1e-5)
+
+
+def test_drain_without_submissions():
+    compositor = AsyncCompositor(_full_chain())
+    assert compositor.drain() is None
+
+
+def test_drained_compositor_refuses_reuse():
+    compositor = AsyncCompositor(_full_chain())
+    compositor.drain()
+    with pytest.raises(RuntimeError):
+        compositor.submit(np.zeros((2, 2), dtype=np.float32))
+    with pytest.raises(RuntimeError):
+        compositor.drain()
+
+
+def test_compositing_errors_propagate_to_caller():
+    post = _full_chain()
+    post._passes["hdr"] = {"enabled": True}  # missing "exposure"
+    compositor = AsyncCompositor(post)
+    compositor.submit(np.zeros((2, 2), dtype=np.float32))
+    with pytest.raises(KeyError):
+        compositor.submit(np.zeros((2, 2), dtype=np.float32))
+    # The worker survived the failing frame and composited the next one,
+    # which fails the same way; drain re-raises it and still shuts down.
+    with pytest.raises(KeyError):
+        compositor.drain()
+    assert not compositor._worker.is_alive()
@@ -0,0 +1,71 @@
+"""Tests for batched draw submission (generated bindings)."""
+
+import numpy as np
+
+from app import App
+from mesh import Mesh
+from renderqueue import RenderQueue
+from sprite import Sprite
+
+
+def test_same_texture_sprites_coalesce_into_one_batch():
+    queue = RenderQueue()
+    for _ in range(5):
+        Sprite("assets/player.png").draw(queue)
+    batches = queue.flush()
+    assert len(batches) == 1
+    assert batches[0].submissions == 5
+    assert batches[0].vertices.shape == (5 * 6,)
+
+
+def test_two_textures_become_two_draws():
+    queue = RenderQueue()
+    for _ in range(3):
+        Sprite("assets/player.png").draw(queue)
+    for _ in range(4):
+        Sprite("assets/enemy.png").draw(queue)
+    batches = queue.flush()
+    assert len(batches) == 2
+    assert sorted(b.submissions for b in batches) == [3, 4]
+
+
+def test_interleaved_submissions_still_coalesce():
+    queue = RenderQueue()
+    a = Sprite("assets/a.png")
+    b = Sprite("assets/b.png")
+    for _ in range(3):
+        a.draw(queue)
+        b.draw(queue)
+    batches = queue.flush()
+    assert len(batches) == 2
+    assert all(batch.submissions == 3 for batch in batches)
+
+
+def test_flush_clears_queue():
+    queue = RenderQueue()
+    Sprite("assets/a.png").draw(queue)
+    queue.flush()
+    assert len(queue) == 0
+    assert queue.flush() == []
+
+
+def test_mesh_submissions_keyed_by_geometry_and_material():
+    queue = RenderQueue()
+    vertices = np.zeros((3, 8), dtype=np.float32)
+    Mesh.cube(1.0).draw(queue, vertices)
+    Mesh.cube(1.0).draw(queue, vertices)
+    Mesh.sphere().draw(queue, vertices)
+    batches = queue.flush()
+    assert len(batches) == 2
+
+
+def test_app_flushes_render_queue_per_frame():
+    app = App(target_fps=0)
+    app.render_queue = RenderQueue()
+
+    @app.system
+    def draw():
+        Sprite("assets/player.png").draw(app.render_queue)
+
+    app.run(max_frames=2)
+    assert len(app.render_queue) == 0
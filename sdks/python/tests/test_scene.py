@@ -0,0 +1,80 @@
+"""Tests for the SoA scene components (windjammer_sdk.scene)."""
+
+import numpy as np
+
+from windjammer_sdk.scene import LightPool, PointLight, Transform, TransformPool
+
+
+def test_transform_proxies_share_pool_rows():
+    pool = TransformPool(capacity=1)
+    a = Transform(pool)
+    b = Transform(pool)  # forces a grow
+    a.position = (1.0, 2.0, 3.0)
+    b.scale = (2.0, 2.0, 2.0)
+    assert len(pool) == 2
+    assert np.allclose(pool.position[0], [1.0, 2.0, 3.0])
+    assert np.allclose(a.position, [1.0, 2.0, 3.0])
+    assert np.allclose(b.scale, 2.0)
+    # Default scale survives the grow and stays 1 for fresh rows.
+    assert np.allclose(a.scale, 1.0)
+    # position is a view: writes through the pool are visible.
+    pool.position[0, 1] = 9.0
+    assert a.position[1] == 9.0
+
+
+def test_pool_advance_is_one_vectorized_pass():
+    pool = TransformPool(capacity=8)
+    t0, t1 = Transform(pool), Transform(pool)
+    pool.velocity[:2] = [(1.0, 0.0, 0.0), (0.0, 2.0, 0.0)]
+    pool.advance(0.5)
+    assert np.allclose(t0.position, [0.5, 0.0, 0.0])
+    assert np.allclose(t1.position, [0.0, 1.0, 0.0])
+
+
+def test_world_matrix_composes_trs():
+    pool = TransformPool(capacity=4)
+    t = Transform(pool)
+    t.position = (1.0, 2.0, 3.0)
+    t.scale = (2.0, 2.0, 2.0)
+    m = t.world_matrix()
+    assert np.allclose(m[:3, 3], [1.0, 2.0, 3.0])
+    assert np.allclose(m[:3, :3], np.eye(3) * 2.0)
+    assert np.allclose(m[3], [0.0, 0.0, 0.0, 1.0])
+
+
+def test_world_matrix_cached_until_invalidated():
+    pool = TransformPool(capacity=4)
+    t = Transform(pool)
+    first = t.world_matrix()
+    assert not pool.dirty[0]
+    # Clean rows return the cached matrix without recomposing.
+    assert t.world_matrix() is first or np.shares_memory(t.world_matrix(), first)
+    t.rotation = (0.0, 0.0, np.pi / 2.0)
+    assert pool.dirty[0]
+    m = t.world_matrix()
+    assert not pool.dirty[0]
+    assert np.allclose(m[:3, 0], [0.0, 1.0, 0.0], atol=1e-6)
+
+
+def test_advance_dirties_only_moving_rows():
+    pool = TransformPool(capacity=4)
+    static, mover = Transform(pool), Transform(pool)
+    static.world_matrix()
+    mover.world_matrix()
+    pool.velocity[1] = (1.0, 0.0, 0.0)
+    pool.advance(1.0)
+    assert not pool.dirty[0]
+    assert pool.dirty[1]
+    assert np.allclose(mover.world_matrix()[:3, 3], [1.0, 0.0, 0.0])
+
+
+def test_point_light_pool_fields():
+    pool = LightPool(capacity=1)
+    light = PointLight(pool)
+    second = PointLight(pool)
+    light.position = (0.0, 3.0, 0.0)
+    light.intensity = 2.5
+    second.color = (1.0, 0.0, 0.0, 1.0)
+    assert light.intensity == 2.5
+    assert np.allclose(pool.position[0], [0.0, 3.0, 0.0])
+    assert np.allclose(second.color, [1.0, 0.0, 0.0, 1.0])
@@ -0,0 +1,84 @@
+"""Tests for the windjammer_sdk App frame loop."""
+
+from windjammer_sdk.app import App
+
+
+def test_run_snapshots_systems_and_counts_frames():
+    app = App(target_fps=0)
+    calls = []
+
+    @app.startup
+    def boot():
+        calls.append("boot")
+
+    @app.system
+    def tick():
+        calls.append("tick")
+
+    @app.shutdown
+    def bye():
+        calls.append("bye")
+
+    frames = app.run(max_frames=3)
+    assert frames == 3
+    assert calls == ["boot", "tick", "tick", "tick", "bye"]
+    assert not app.running
+
+
+def test_quit_stops_loop_and_runs_shutdown():
+    app = App(target_fps=0)
+    seen = []
+
+    @app.system
+    def tick():
+        seen.append(len(seen))
+        if len(seen) == 2:
+            app.quit()
+
+    @app.shutdown
+    def bye():
+        seen.append("done")
+
+    app.run()
+    assert seen == [0, 1, "done"]
+
+
+def test_fused_systems_share_one_column_pass():
+    import numpy as np
+
+    app = App(target_fps=0)
+    pos = np.zeros(4, dtype=np.float32)
+    vel = np.ones(4, dtype=np.float32)
+    app.set_column("pos_x", pos).set_column("vel_x", vel)
+
+    order = []
+
+    def integrate(p, v):
+        order.append("integrate")
+        p += v
+
+    def damp(p, v):
+        order.append("damp")
+        v *= 0.5
+
+    def audio_follow(p,):
+        order.append("audio")
+
+    app.add_fused_system(("pos_x", "vel_x"), integrate)
+    app.add_fused_system(("pos_x", "vel_x"), damp)
+    app.add_fused_system(("pos_x",), audio_follow)
+
+    app.run(max_frames=2)
+    # Same-signature kernels run back to back within each frame.
+    assert order == ["integrate", "damp", "audio"] * 2
+    assert np.allclose(pos, 1.5)
+    assert np.allclose(vel, 0.25)
+
+
+def test_empty_app_allocates_no_system_lists():
+    app = App(target_fps=0)
+    assert app._systems is None
+    assert app._startup_systems is None
+    assert app.run(max_frames=1) == 1
+    app.add_system(lambda: None)
+    assert app._systems is not None
@@ -0,0 +1,38 @@
+"""Tests for windjammer_sdk.input bitset state."""
+
+from windjammer_sdk.input import Input, KeyCode, MouseButton
+
+
+def test_key_press_release():
+    state = Input()
+    assert not state.is_key_pressed(KeyCode.W)
+    state.press_key(KeyCode.W)
+    state.press_key(KeyCode.Space)
+    assert state.is_key_pressed(KeyCode.W)
+    assert state.is_key_pressed(KeyCode.Space)
+    assert not state.is_key_pressed(KeyCode.A)
+    state.release_key(KeyCode.W)
+    assert not state.is_key_pressed(KeyCode.W)
+    assert state.is_key_pressed(KeyCode.Space)
+
+
+def test_mouse_buttons_and_clear():
+    state = Input()
+    state.press_mouse_button(MouseButton.Left)
+    assert state.is_mouse_button_pressed(MouseButton.Left)
+    assert not state.is_mouse_button_pressed(MouseButton.Right)
+    state.press_key(KeyCode.Escape)
+    state.clear()
+    assert not state.is_mouse_button_pressed(MouseButton.Left)
+    assert not state.is_key_pressed(KeyCode.Escape)
+
+
+def test_keycode_values_are_dense_bit_indices():
+    values = sorted(k.value for k in KeyCode)
+    assert values == list(range(len(KeyCode)))
+
+
+def test_keycode_compares_as_int_and_prints_as_name():
+    assert KeyCode.A == 0
+    assert str(KeyCode.Space) == "Space"
+    assert f"{KeyCode.W}" == "W"
@@ -0,0 +1,26 @@
+"""Tests for the windjammer_sdk SoA entity world."""
+
+import numpy as np
+
+from windjammer_sdk.world import World
+
+
+def test_query_returns_live_views():
+    world = World(capacity=4)
+    world.spawn(position=(1.0, 0.0, 0.0), velocity=(0.0, 1.0, 0.0))
+    world.spawn(position=(2.0, 0.0, 0.0))
+    positions = world.query("position")
+    assert positions.shape == (2, 3)
+    positions[:, 0] += 1.0
+    assert np.allclose(world.query("position")[:, 0], [2.0, 3.0])
+
+
+def test_integrate_is_vectorized_over_all_entities():
+    world = World(capacity=2)
+    for i in range(5):  # force growth past capacity
+        world.spawn(position=(float(i), 0.0, 0.0), velocity=(1.0, 2.0, 0.0))
+    assert world.entity_count == 5
+    world.integrate(0.5)
+    positions = world.query("position")
+    assert np.allclose(positions[:, 0], [0.5, 1.5, 2.5, 3.5, 4.5])
+    assert np.allclose(positions[:, 1], 1.0)
@@ -0,0 +1,43 @@
+"""Tests for the SoA TransformBuffer (generated bindings)."""
+
+import numpy as np
+import pytest
+
+from transformbuffer import TransformBuffer
+
+
+def test_allocate_and_view():
+    buf = TransformBuffer(capacity=8)
+    i = buf.allocate()
+    view = buf.view(i)
+    view.x = 1.5
+    view.y = -2.0
+    assert buf.x[i] == pytest.approx(1.5)
+    assert buf.y[i] == pytest.approx(-2.0)
+    assert view.z == 0.0
+
+
+def test_capacity_exhausted():
+    buf = TransformBuffer(capacity=1)
+    buf.allocate()
+    with pytest.raises(IndexError):
+        buf.allocate()
+
+
+def test_integrate_vectorized():
+    buf = TransformBuffer(capacity=4)
+    for _ in range(3):
+        buf.allocate()
+    buf.vx[:3] = [1.0, 2.0, 3.0]
+    buf.integrate(dt=0.5)
+    assert np.allclose(buf.x[:3], [0.5, 1.0, 1.5])
+    # Unallocated rows are untouched.
+    assert buf.x[3] == 0.0
+
+
+def test_ffi_args():
+    buf = TransformBuffer(capacity=2)
+    buf.allocate()
+    ptr, count = buf.ffi_args()
+    assert ptr == buf._data.ctypes.data
+    assert count == 1
@@ -0,0 +1,71 @@
+"""Tests for the update/render triple buffer."""
+
+import threading
+
+import numpy as np
+
+from triplebuffer import TripleBuffer
+
+
+def test_consumer_sees_latest_published_frame():
+    tb = TripleBuffer(shape=4)
+
+    tb.write_buffer()[:] = 1.0
+    tb.publish()
+    buf, fresh = tb.acquire()
+    assert fresh
+    assert np.allclose(buf, 1.0)
+
+
+def test_stale_acquire_returns_previous_frame():
+    tb = TripleBuffer(shape=2)
+    tb.write_buffer()[:] = 7.0
+    tb.publish()
+    first, fresh = tb.acquire()
+    assert fresh
+    again, fresh = tb.acquire()
+    assert not fresh
+    assert np.allclose(again, 7.0)
+
+
+def test_producer_never_stalls_and_consumer_skips_frames():
+    tb = TripleBuffer(shape=1)
+    # Producer runs ahead: publishes three frames with no consumer.
+    for value in (1.0, 2.0, 3.0):
+        tb.write_buffer()[:] = value
+        tb.publish()
+    buf, fresh = tb.acquire()
+    assert fresh
+    # The consumer gets the newest frame, not the backlog.
+    assert buf[0] == 3.0
+
+
+def test_threaded_producer_consumer():
+    tb = TripleBuffer(shape=1)
+    frames = 200
+    seen = []
+
+    def producer():
+        for i in range(1, frames + 1):
+            tb.write_buffer()[:] = float(i)
+            tb.publish()
+
+    def consumer():
+        last = 0.0
+        while last < frames:
+            buf, fresh = tb.acquire()
+            if fresh:
+                value = float(buf[0])
+                # Frames arrive in order (some may be skipped).
+                assert value > last
+                last = value
+                seen.append(value)
+
+    t_prod = threading.Thread(target=producer)
+    t_cons = threading.Thread(target=consumer)
+    t_cons.start()
+    t_prod.start()
+    t_prod.join()
+    t_cons.join()
+
+    assert seen[-1] == float(frames)
@@ -0,0 +1,40 @@
+"""Tests for World/Entity (generated bindings)."""
+
+import numpy as np
+import pytest
+
+from entity import Entity
+from world import World
+
+
+def test_create_entity_assigns_ids():
+    world = World(capacity=8)
+    a = world.create_entity()
+    b = world.create_entity()
+    assert (a.id, b.id) == (0, 1)
+    assert world.entity_count == 2
+
+
+def test_entity_transform_view_is_live():
+    world = World(capacity=4)
+    e = world.create_entity()
+    e.transform.x = 3.0
+    assert world.query_transforms().x[e.id] == pytest.approx(3.0)
+
+
+def test_step_integrates_velocities():
+    world = World(capacity=4)
+    e = world.create_entity()
+    transforms = world.query_transforms()
+    transforms.vx[e.id] = 2.0
+    transforms.vy[e.id] = -1.0
+
+    world.step(dt=0.5)
+
+    assert e.transform.x == pytest.approx(1.0)
+    assert e.transform.y == pytest.approx(-0.5)
+    assert e.transform.z == 0.0
+
+
+def test_detached_entity_has_no_transform():
+    assert Entity().transform is None
@@ -0,0 +1,38 @@
+"""Windjammer Python SDK.
+
+Submodules are imported lazily (PEP 562): ``from windjammer_sdk import
+Vec3`` pulls in only ``math``, not the ctypes FFI layer or the app
+loop, which keeps import time low for scripts and tests that need a
+single type.
+"""
+
+import importlib
+
+__version__ = "0.48.0"
+
+# Public name -> submodule that defines it.
+_LAZY = {
+    "App": "app",
+    "Color": "math",
+    "Input": "input",
+    "KeyCode": "input",
+    "MouseButton": "input",
+    "Quat": "math",
+    "Vec2": "math",
+    "Vec3": "math",
+    "Vec3Array": "ffi",
+    "Vec4": "math",
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is not None:
+        return getattr(importlib.import_module(f".{module}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
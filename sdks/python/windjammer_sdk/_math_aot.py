@@ -0,0 +1,71 @@
+"""Ahead-of-time compiled math kernels.
+
+The batched kernels below operate on float32 arrays. At build time
+(``python setup.py build_aot``) they are compiled with ``numba.pycc``
+into a ``windjammer_math`` extension shipped inside the wheel, so user
+startup never pays Numba's JIT compile cost. At import time the compiled
+module is preferred; without it the plain-Python definitions are used
+(and Numba, if installed, may still JIT them lazily elsewhere).
+"""
+
+try:
+    from numba.pycc import CC
+except ImportError:
+    CC = None
+
+# pycc writes the extension next to this module by default, which is
+# exactly where load_kernels()'s relative import expects it.
+cc = CC("windjammer_math") if CC is not None else None
+
+
+def _export(name, signature):
+    """Register a kernel with the AOT compiler when it is available."""
+
+    def decorate(func):
+        if cc is not None:
+            cc.export(name, signature)(func)
+        return func
+
+    return decorate
+
+
+@_export("vec2_add", "f4[:](f4[:], f4[:])")
+def vec2_add(a, b):
+    return a + b
+
+
+@_export("vec3_add", "f4[:](f4[:], f4[:])")
+def vec3_add(a, b):
+    return a + b
+
+
+@_export("vec3_dot", "f4(f4[:], f4[:])")
+def vec3_dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+@_export("vec3_normalize", "f4[:](f4[:])")
+def vec3_normalize(a):
+    length = (a[0] * a[0] + a[1] * a[1] + a[2] * a[2]) ** 0.5
+    if length > 0:
+        return a / length
+    return a * 0.0
+
+
+def compile_aot():
+    """Compile the exported kernels to a native module (build-time hook)."""
+    if cc is None:
+        raise RuntimeError("numba is required to build the AOT math kernels")
+    cc.compile()
+
+
+def load_kernels():
+    """Return the kernel namespace, preferring the AOT-compiled module."""
+    try:
+        from . import windjammer_math  # noqa: F401  (built by compile_aot)
+
+        return windjammer_math
+    except ImportError:
+        import sys
+
+        return sys.modules[__name__]
@@ -0,0 +1,170 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled Vec3 for the Windjammer Python SDK.
+
+Mirrors the pure-Python Vec3 in ``math.py`` (which transparently
+re-exports this class when the extension is built). Components are C
+floats in the object struct, so arithmetic runs without interpreter
+dispatch or attribute-dict traffic.
+"""
+
+from libc.math cimport sqrtf
+
+
+cdef class Vec3:
+    """3D vector."""
+
+    cdef public float x
+    cdef public float y
+    cdef public float z
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __repr__(self):
+        return f"Vec3({self.x}, {self.y}, {self.z})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Vec3):
+            return NotImplemented
+        cdef Vec3 o = <Vec3>other
+        return self.x == o.x and self.y == o.y and self.z == o.z
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+    def __add__(self, Vec3 other):
+        return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, Vec3 other):
+        return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, double scalar):
+        return Vec3(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    def __rmul__(self, double scalar):
+        return Vec3(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    def __iadd__(self, Vec3 other):
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+
+    def __isub__(self, Vec3 other):
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return self
+
+    def __imul__(self, double scalar):
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+
+    # Fused `a + b * t`, mirroring math.py: one allocation for the
+    # allocating form, zero for the in-place one (owned vectors only).
+    cpdef Vec3 add_scaled(self, Vec3 other, double t):
+        return Vec3(self.x + other.x * t, self.y + other.y * t, self.z + other.z * t)
+
+    cpdef Vec3 add_scaled_(self, Vec3 other, double t):
+        self.x += other.x * t
+        self.y += other.y * t
+        self.z += other.z * t
+        return self
+
+    cpdef float dot(self, Vec3 other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    cpdef Vec3 cross(self, Vec3 other):
+        return Vec3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    cpdef float length(self):
+        return sqrtf(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    cpdef Vec3 normalize(self):
+        cdef float length = self.length()
+        cdef float inv
+        if length > 1e-8:
+            inv = 1.0 / length
+            return Vec3(self.x * inv, self.y * inv, self.z * inv)
+        return Vec3(0.0, 0.0, 0.0)
+
+    # Shared frozen singletons, matching the pure-Python class (the
+    # instances are created below the subclass definition).
+    @staticmethod
+    def zero():
+        return _ZERO
+
+    @staticmethod
+    def one():
+        return _ONE
+
+    @staticmethod
+    def up():
+        return _UP
+
+    @classmethod
+    def from_batch(cls, batch, i):
+        """Materialize row ``i`` of a :class:`Vec3Batch` as a Vec3."""
+        row = batch._data[i]
+        return cls(float(row[0]), float(row[1]), float(row[2]))
+
+    @classmethod
+    def from_numpy(cls, arr):
+        return [cls(float(x), float(y), float(z)) for x, y, z in arr]
+
+    @staticmethod
+    def to_numpy(vectors):
+        import numpy as np
+
+        return np.array([(v.x, v.y, v.z) for v in vectors], dtype=np.float32)
+
+
+cdef class _FrozenVec3(Vec3):
+    """Immutable Vec3 backing the shared zero()/one()/up() singletons.
+
+    ``__setattr__`` blocks Python-level writes; the in-place operators
+    are overridden as well because compiled methods write the C fields
+    directly, bypassing ``__setattr__``.
+    """
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Vec3 singleton is immutable; construct Vec3() instead")
+
+    def __delattr__(self, name):
+        raise AttributeError("Vec3 singleton is immutable; construct Vec3() instead")
+
+    def __iadd__(self, other):
+        raise AttributeError("Vec3 singleton is immutable; construct Vec3() instead")
+
+    def __isub__(self, other):
+        raise AttributeError("Vec3 singleton is immutable; construct Vec3() instead")
+
+    def __imul__(self, scalar):
+        raise AttributeError("Vec3 singleton is immutable; construct Vec3() instead")
+
+    cpdef Vec3 add_scaled_(self, Vec3 other, double t):
+        raise AttributeError("Vec3 singleton is immutable; construct Vec3() instead")
+
+
+cdef Vec3 _ZERO = _FrozenVec3(0.0, 0.0, 0.0)
+cdef Vec3 _ONE = _FrozenVec3(1.0, 1.0, 1.0)
+cdef Vec3 _UP = _FrozenVec3(0.0, 1.0, 0.0)
+
+
+cpdef void dot_batch(float[:, ::1] a, float[:, ::1] b, float[::1] out) noexcept nogil:
+    """Row-wise dots of two C-contiguous (N, 3) float32 blocks into out.
+
+    nogil so frame-update threads can run it concurrently; the plain
+    indexed loop auto-vectorizes under -O3 -march=native.
+    """
+    cdef Py_ssize_t i
+    for i in range(a.shape[0]):
+        out[i] = a[i, 0] * b[i, 0] + a[i, 1] * b[i, 1] + a[i, 2] * b[i, 2]
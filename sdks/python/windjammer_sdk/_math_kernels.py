@@ -0,0 +1,82 @@
+"""Numba-JIT math kernels for the Windjammer Python SDK.
+
+Scalar kernels take unpacked components so numba compiles them to a
+handful of FP instructions with no object traffic; the batch kernels
+use ``prange`` loops that numba parallelizes and auto-vectorizes.
+Everything also runs as plain Python when numba is missing -
+``HAVE_NUMBA`` tells callers whether delegating here is a win.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional extra
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels run as plain Python without numba."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _dot3(ax, ay, az, bx, by, bz):
+    return ax * bx + ay * by + az * bz
+
+
+@njit(cache=True, fastmath=True)
+def _cross3(ax, ay, az, bx, by, bz):
+    return (ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
+
+
+@njit(cache=True, fastmath=True)
+def _length3(ax, ay, az):
+    return math.sqrt(ax * ax + ay * ay + az * az)
+
+
+@njit(cache=True, fastmath=True)
+def _normalize3(ax, ay, az):
+    length = math.sqrt(ax * ax + ay * ay + az * az)
+    if length > 1e-8:
+        inv = 1.0 / length
+        return (ax * inv, ay * inv, az * inv)
+    return (0.0, 0.0, 0.0)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def dot3_batch(a, b, out):
+    """Row-wise dots of two (N, 3) arrays into ``out``."""
+    for i in prange(a.shape[0]):
+        out[i] = a[i, 0] * b[i, 0] + a[i, 1] * b[i, 1] + a[i, 2] * b[i, 2]
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def cross3_batch(a, b, out):
+    """Row-wise cross products of two (N, 3) arrays into ``out``."""
+    for i in prange(a.shape[0]):
+        out[i, 0] = a[i, 1] * b[i, 2] - a[i, 2] * b[i, 1]
+        out[i, 1] = a[i, 2] * b[i, 0] - a[i, 0] * b[i, 2]
+        out[i, 2] = a[i, 0] * b[i, 1] - a[i, 1] * b[i, 0]
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def normalize3_batch(a):
+    """Normalize each row of an (N, 3) array in place; zero rows stay zero."""
+    for i in prange(a.shape[0]):
+        mag2 = a[i, 0] * a[i, 0] + a[i, 1] * a[i, 1] + a[i, 2] * a[i, 2]
+        if mag2 > 0.0:
+            inv = 1.0 / np.sqrt(mag2)
+            a[i, 0] *= inv
+            a[i, 1] *= inv
+            a[i, 2] *= inv
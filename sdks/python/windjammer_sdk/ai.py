@@ -0,0 +1,156 @@
+"""AI helpers for the Windjammer Python SDK."""
+
+import logging
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional extra
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels run as plain Python without numba."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+
+        return wrap
+
+logger = logging.getLogger("windjammer")
+
+_NO_PATH = np.empty((0, 2), dtype=np.float32)
+
+
+@njit(cache=True)
+def _astar(grid, sx, sy, gx, gy):
+    """A* over an int8 occupancy grid (0 free, nonzero blocked).
+
+    Returns the path as an (N, 2) float32 array of (x, y) cells from
+    start to goal inclusive, or an empty array when unreachable. All
+    state lives in flat parallel arrays - g-costs, parent links and a
+    binary heap stored as two arrays - so numba lowers the whole search
+    to native code with no per-node Python objects.
+    """
+    h, w = grid.shape
+    n = h * w
+    start = sy * w + sx
+    goal = gy * w + gx
+
+    g_cost = np.full(n, np.inf, dtype=np.float32)
+    came_from = np.full(n, -1, dtype=np.int32)
+    closed = np.zeros(n, dtype=np.uint8)
+
+    # Binary min-heap as parallel (priority, node) arrays. Stale entries
+    # are skipped via the closed set, so 8x slack covers re-pushes.
+    heap_cost = np.empty(8 * n, dtype=np.float32)
+    heap_node = np.empty(8 * n, dtype=np.int32)
+    size = 0
+
+    g_cost[start] = 0.0
+    heap_cost[0] = abs(gx - sx) + abs(gy - sy)
+    heap_node[0] = start
+    size = 1
+
+    while size > 0:
+        # Pop the minimum: swap last into root, sift down.
+        node = heap_node[0]
+        size -= 1
+        heap_cost[0] = heap_cost[size]
+        heap_node[0] = heap_node[size]
+        i = 0
+        while True:
+            left = 2 * i + 1
+            right = left + 1
+            smallest = i
+            if left < size and heap_cost[left] < heap_cost[smallest]:
+                smallest = left
+            if right < size and heap_cost[right] < heap_cost[smallest]:
+                smallest = right
+            if smallest == i:
+                break
+            heap_cost[i], heap_cost[smallest] = heap_cost[smallest], heap_cost[i]
+            heap_node[i], heap_node[smallest] = heap_node[smallest], heap_node[i]
+            i = smallest
+
+        if closed[node]:
+            continue
+        closed[node] = 1
+
+        if node == goal:
+            # Walk parent links, then reverse into start->goal order.
+            length = 0
+            cursor = node
+            while cursor != -1:
+                length += 1
+                cursor = came_from[cursor]
+            path = np.empty((length, 2), dtype=np.float32)
+            cursor = node
+            for k in range(length - 1, -1, -1):
+                path[k, 0] = cursor % w
+                path[k, 1] = cursor // w
+                cursor = came_from[cursor]
+            return path
+
+        x = node % w
+        y = node // w
+        tentative = g_cost[node] + 1.0
+        for d in range(4):
+            if d == 0:
+                nx, ny = x + 1, y
+            elif d == 1:
+                nx, ny = x - 1, y
+            elif d == 2:
+                nx, ny = x, y + 1
+            else:
+                nx, ny = x, y - 1
+            if nx < 0 or nx >= w or ny < 0 or ny >= h:
+                continue
+            if grid[ny, nx] != 0:
+                continue
+            neighbor = ny * w + nx
+            if closed[neighbor] or tentative >= g_cost[neighbor]:
+                continue
+            g_cost[neighbor] = tentative
+            came_from[neighbor] = node
+            # Push with sift-up.
+            priority = tentative + abs(gx - nx) + abs(gy - ny)
+            j = size
+            heap_cost[j] = priority
+            heap_node[j] = neighbor
+            size += 1
+            while j > 0:
+                parent = (j - 1) // 2
+                if heap_cost[parent] <= heap_cost[j]:
+                    break
+                heap_cost[j], heap_cost[parent] = heap_cost[parent], heap_cost[j]
+                heap_node[j], heap_node[parent] = heap_node[parent], heap_node[j]
+                j = parent
+
+    return _NO_PATH
+
+
+class Pathfinder:
+    """Grid pathfinding over an int8 occupancy grid (0 free, 1 blocked)."""
+
+    __slots__ = ("grid", "path")
+
+    def __init__(self, grid=None):
+        self.grid = None if grid is None else np.ascontiguousarray(grid, dtype=np.int8)
+        self.path = None
+
+    def find_path(self, start, goal):
+        """Waypoints from ``start`` to ``goal``.
+
+        With a grid, runs the JIT A* kernel and returns (and stores on
+        ``self.path``) an (N, 2) float32 array of cells; convert to
+        vector objects only at the edge if needed. Without a grid,
+        returns the straight line as before.
+        """
+        logger.debug("find_path: %s -> %s", start, goal)
+        if self.grid is None:
+            return [start, goal]
+        self.path = _astar(
+            self.grid, int(start[0]), int(start[1]), int(goal[0]), int(goal[1])
+        )
+        return self.path
@@ -0,0 +1,137 @@
+"""Application and game-loop entry point for the Windjammer Python SDK."""
+
+import logging
+import time
+
+logger = logging.getLogger("windjammer")
+
+_NS_PER_SEC = 1_000_000_000
+
+
+class App:
+    """Owns the system lists and drives the frame loop."""
+
+    def __init__(self, title="Windjammer App", target_fps=60):
+        self.title = title
+        self.target_fps = target_fps
+        self.running = False
+        # Lazily allocated on first registration: a zero-system App
+        # (common in tests and tools) costs no container allocations.
+        self._startup_systems = None
+        self._systems = None
+        self._shutdown_systems = None
+        # Component column name -> SoA array, shared by fused systems.
+        self.columns = {}
+        self._fused = None
+
+    def add_startup_system(self, system):
+        if self._startup_systems is None:
+            self._startup_systems = []
+        self._startup_systems.append(system)
+        return self
+
+    def add_system(self, system):
+        if self._systems is None:
+            self._systems = []
+        self._systems.append(system)
+        return self
+
+    def add_shutdown_system(self, system):
+        if self._shutdown_systems is None:
+            self._shutdown_systems = []
+        self._shutdown_systems.append(system)
+        return self
+
+    def set_column(self, name, array):
+        """Register a component SoA column for fused systems to share."""
+        self.columns[name] = array
+        return self
+
+    def add_fused_system(self, query_spec, kernel):
+        """Register ``kernel`` against the columns named in ``query_spec``.
+
+        Kernels declaring the same column signature are fused into one
+        pass: the columns are fetched once and every kernel in the group
+        runs against them back to back, so a frame touches each column's
+        memory once instead of once per system. Kernels receive the
+        column arrays positionally, in ``query_spec`` order, and must
+        mutate them in place (splitting a column breaks the sharing
+        invariant).
+        """
+        if self._fused is None:
+            self._fused = {}
+        key = tuple(query_spec)
+        self._fused.setdefault(key, []).append(kernel)
+        return self
+
+    def _fused_passes(self):
+        """One callable per column signature, closed over its kernels."""
+        passes = []
+        columns = self.columns
+        for key, kernels in (self._fused or {}).items():
+            group = tuple(kernels)
+
+            def run_pass(_key=key, _group=group):
+                args = tuple(columns[name] for name in _key)
+                for kernel in _group:
+                    kernel(*args)
+
+            passes.append(run_pass)
+        return passes
+
+    def system(self, fn):
+        """Decorator form of :meth:`add_system`."""
+        self.add_system(fn)
+        return fn
+
+    def startup(self, fn):
+        """Decorator form of :meth:`add_startup_system`."""
+        self.add_startup_system(fn)
+        return fn
+
+    def shutdown(self, fn):
+        """Decorator form of :meth:`add_shutdown_system`."""
+        self.add_shutdown_system(fn)
+        return fn
+
+    def quit(self):
+        self.running = False
+
+    def run(self, max_frames=None):
+        """Run startup systems, then the frame loop until :meth:`quit`.
+
+        The system lists are snapshotted into tuples up front and the
+        inner loop is a bare ``for system in update: system()`` — no
+        per-call try/except and no attribute traffic on ``self``. One
+        exception frame wraps the whole loop; registration after
+        ``run()`` starts is not supported.
+        """
+        startup = tuple(self._startup_systems or ())
+        update = tuple(self._systems or ()) + tuple(self._fused_passes())
+        shutdown = tuple(self._shutdown_systems or ())
+
+        frame_ns = _NS_PER_SEC // self.target_fps if self.target_fps else 0
+        perf_ns = time.perf_counter_ns
+
+        self.running = True
+        frames = 0
+        try:
+            for system in startup:
+                system()
+            while self.running:
+                frame_start = perf_ns()
+                for system in update:
+                    system()
+                frames += 1
+                if max_frames is not None and frames >= max_frames:
+                    break
+                elapsed = perf_ns() - frame_start
+                if frame_ns and elapsed < frame_ns:
+                    time.sleep((frame_ns - elapsed) / _NS_PER_SEC)
+        except KeyboardInterrupt:
+            logger.debug("interrupted after %d frames", frames)
+        finally:
+            self.running = False
+            for system in shutdown:
+                system()
+        return frames
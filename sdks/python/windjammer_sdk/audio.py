@@ -0,0 +1,89 @@
+"""Audio playback for the Windjammer Python SDK."""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger("windjammer")
+
+
+class AudioWorld:
+    """Owns the position data for every audio source as one SoA block.
+
+    Positions live in a single (capacity, 3) float32 array; sources hold
+    an index into it. Per-frame mixer math (attenuation, Doppler) is one
+    vectorized pass over contiguous memory instead of a walk over
+    scattered vector objects.
+    """
+
+    __slots__ = ("_positions", "_count")
+
+    def __init__(self, capacity=64):
+        self._positions = np.zeros((capacity, 3), dtype=np.float32)
+        self._count = 0
+
+    def register(self):
+        """Reserve a position row, growing the block as needed."""
+        if self._count == len(self._positions):
+            grown = np.zeros((len(self._positions) * 2, 3), dtype=np.float32)
+            grown[: self._count] = self._positions[: self._count]
+            self._positions = grown
+        index = self._count
+        self._count += 1
+        return index
+
+    @property
+    def positions(self):
+        """(count, 3) view over all live source positions."""
+        return self._positions[: self._count]
+
+    def compute_gains(self, listener_pos, out=None):
+        """Inverse-square attenuation for every source in one pass."""
+        offsets = self.positions - np.asarray(listener_pos, dtype=np.float32)
+        dist_sq = np.einsum("ij,ij->i", offsets, offsets)
+        return np.divide(1.0, 1.0 + dist_sq, out=out)
+
+
+_default_world = AudioWorld()
+
+
+class AudioSource:
+    """A playable sound tied to one audio file."""
+
+    __slots__ = ("audio_file", "volume", "looping", "playing", "_world", "_index")
+
+    def __init__(self, audio_file, volume=1.0, looping=False, world=None):
+        self.audio_file = audio_file
+        self.volume = volume
+        self.looping = looping
+        self.playing = False
+        self._world = world if world is not None else _default_world
+        self._index = self._world.register()
+
+    def __repr__(self):
+        return f"AudioSource({self.audio_file!r})"
+
+    @property
+    def position(self):
+        """This source's (3,) row in the world's SoA block (a view)."""
+        return self._world._positions[self._index]
+
+    @position.setter
+    def position(self, value):
+        row = self._world._positions[self._index]
+        if hasattr(value, "x"):
+            row[0] = value.x
+            row[1] = value.y
+            row[2] = value.z
+        else:
+            row[:] = value
+
+    def play(self):
+        # debug + %s: under the default WARNING level this is a single
+        # isEnabledFor check, with no string formatting on the hot path.
+        logger.debug("Playing: %s", self.audio_file)
+        self.playing = True
+
+    def stop(self):
+        logger.debug("Stopping: %s", self.audio_file)
+        self.playing = False
@@ -0,0 +1,210 @@
+"""ctypes bindings to the native windjammer runtime library.
+
+Loads ``libwindjammer`` when present and declares the ``wj_*`` call
+signatures. Everything degrades gracefully when the native library is
+not built: ``_lib`` is ``None`` and callers fall back to pure Python.
+"""
+
+import ctypes
+import os
+import platform
+from ctypes import POINTER, c_float, c_int, c_size_t
+
+import numpy as np
+
+
+class WjVec2(ctypes.Structure):
+    _fields_ = [("x", c_float), ("y", c_float)]
+
+
+class WjVec3(ctypes.Structure):
+    _fields_ = [("x", c_float), ("y", c_float), ("z", c_float)]
+
+
+class WjVec4(ctypes.Structure):
+    _fields_ = [("x", c_float), ("y", c_float), ("z", c_float), ("w", c_float)]
+
+
+class WjColor(ctypes.Structure):
+    _fields_ = [("r", c_float), ("g", c_float), ("b", c_float), ("a", c_float)]
+
+
+def _get_library_path():
+    """Locate the native library; returns None when it isn't built."""
+    override = os.environ.get("WINDJAMMER_LIBRARY")
+    if override:
+        return override if os.path.exists(override) else None
+
+    system = platform.system()
+    if system == "Windows":
+        name = "windjammer.dll"
+    elif system == "Darwin":
+        name = "libwindjammer.dylib"
+    else:
+        name = "libwindjammer.so"
+
+    candidate = os.path.join(os.path.dirname(__file__), name)
+    return candidate if os.path.exists(candidate) else None
+
+
+def _load_library():
+    path = _get_library_path()
+    if path is None:
+        return None
+    try:
+        if platform.system() == "Windows":
+            return ctypes.WinDLL(path)
+        # Lazy binding: symbols resolve on first call rather than all at
+        # load time - most wj_* entry points are never touched by a
+        # given process. RTLD_GLOBAL lets companion extensions share
+        # the same symbols instead of loading a second copy.
+        return ctypes.CDLL(path, mode=os.RTLD_LAZY | os.RTLD_GLOBAL)
+    except OSError:
+        return None
+
+
+# Loaded exactly once per process; subpackages import this module-level
+# handle instead of re-probing the search path.
+_lib = _load_library()
+
+# Function pointers are rebound to module-level names below so hot call
+# sites skip the CDLL attribute probe; None when the library isn't
+# built or doesn't export that particular symbol.
+_wj_version_major = None
+_wj_vec2_new = None
+_wj_vec3_new = None
+_wj_vec3_new_batch = None
+_wj_vec3_dot = None
+_wj_vec4_dot = None
+_wj_vec3_bulk_add = None
+_wj_vec3_bulk_dot = None
+_wj_vec3_normalize_inplace = None
+
+def _bind(name, argtypes, restype):
+    """Declare and return one wj_* symbol, or None when the library
+    lacks it - a partial build degrades per symbol, not wholesale."""
+    fn = getattr(_lib, name, None)
+    if fn is not None:
+        fn.argtypes = argtypes
+        fn.restype = restype
+    return fn
+
+
+if _lib is not None:
+    _wj_version_major = _bind("wj_version_major", [], c_int)
+
+    _wj_vec2_new = _bind("wj_vec2_new", [c_float, c_float], WjVec2)
+    _wj_vec3_new = _bind("wj_vec3_new", [c_float, c_float, c_float], WjVec3)
+    # One crossing constructs N vectors: xyz is a packed (N, 3) float32
+    # block, out a caller-owned WjVec3 array.
+    _wj_vec3_new_batch = _bind(
+        "wj_vec3_new_batch", [POINTER(c_float), c_size_t, POINTER(WjVec3)], None
+    )
+
+    # Single-vector dots; the native side dispatches to SSE4.1 DPPS
+    # (one fused multiply-add-and-horizontal-sum) where available.
+    # Python call sites keep the scalar x*x+y*y+z*z form - the FFI
+    # crossing would dwarf the saved arithmetic - but compiled callers
+    # (Cython, the app core) go through these.
+    _wj_vec3_dot = _bind("wj_vec3_dot", [WjVec3, WjVec3], c_float)
+    _wj_vec4_dot = _bind("wj_vec4_dot", [WjVec4, WjVec4], c_float)
+
+    # Bulk kernels take planar SoA streams (x..., y..., z...) so the
+    # native side can vectorize without shuffles.
+    _wj_vec3_bulk_add = _bind(
+        "wj_vec3_bulk_add", [POINTER(c_float)] * 3 + [c_size_t], None
+    )
+    _wj_vec3_bulk_dot = _bind(
+        "wj_vec3_bulk_dot", [POINTER(c_float)] * 3 + [c_size_t], None
+    )
+    _wj_vec3_normalize_inplace = _bind(
+        "wj_vec3_normalize_inplace", [POINTER(c_float), c_size_t], None
+    )
+
+
+class Vec3Array:
+    """SoA batch of 3D vectors backed by one contiguous float32 block.
+
+    Components are stored planar (all x, then all y, then all z), the
+    layout bulk FFI kernels and autovectorizers want; ``buffer_ptr()``
+    plus ``len()`` is the whole FFI contract, one crossing per batch
+    instead of one per element.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, n):
+        self._data = np.zeros((3, n), dtype=np.float32)
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Pack an iterable of Vec3-like objects into a batch."""
+        vectors = list(vectors)
+        batch = cls(len(vectors))
+        for i, v in enumerate(vectors):
+            batch._data[0, i] = v.x
+            batch._data[1, i] = v.y
+            batch._data[2, i] = v.z
+        return batch
+
+    def __len__(self):
+        return self._data.shape[1]
+
+    @property
+    def x(self):
+        return self._data[0]
+
+    @property
+    def y(self):
+        return self._data[1]
+
+    @property
+    def z(self):
+        return self._data[2]
+
+    def buffer_ptr(self):
+        """Raw pointer to the planar float32 block, for ``wj_vec3_bulk_*``."""
+        return self._data.ctypes.data_as(POINTER(c_float))
+
+    def add(self, other, out=None):
+        """Element-wise sum as a new batch (or into `out`)."""
+        if out is None:
+            out = Vec3Array(len(self))
+        np.add(self._data, other._data, out=out._data)
+        return out
+
+    def dot(self, other, out=None):
+        """Row-wise dot products -> (N,) float32 array.
+
+        Batched through the native FMA kernel when the library is built
+        (8 dot results per iteration over the planar streams); numpy
+        einsum otherwise. Single vectors should use ``Vec3.dot`` — the
+        FFI crossing would dominate at N=1.
+        """
+        if _wj_vec3_bulk_dot is not None:
+            if out is None:
+                out = np.empty(len(self), dtype=np.float32)
+            _wj_vec3_bulk_dot(
+                self.buffer_ptr(),
+                other.buffer_ptr(),
+                out.ctypes.data_as(POINTER(c_float)),
+                len(self),
+            )
+            return out
+        return np.einsum("ij,ij->j", self._data, other._data, out=out)
+
+    def normalize_(self):
+        """Normalize every vector in place; zero vectors stay zero.
+
+        Dispatches to the native SIMD kernel when the library is built
+        (8 lanes per iteration via rsqrt over the planar streams);
+        otherwise runs the equivalent vectorized numpy pass. In-place
+        overwrite avoids the O(N) output allocation either way.
+        """
+        if _wj_vec3_normalize_inplace is not None:
+            _wj_vec3_normalize_inplace(self.buffer_ptr(), len(self))
+            return self
+        mag2 = np.einsum("ij,ij->j", self._data, self._data)
+        inv = 1.0 / np.sqrt(np.where(mag2 > 0.0, mag2, 1.0))
+        self._data *= inv
+        return self
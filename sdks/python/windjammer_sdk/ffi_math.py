@@ -0,0 +1,218 @@
+"""FFI-backed math types for the Windjammer Python SDK.
+
+Mirrors the public surface of ``windjammer_sdk.math``. Components live
+as plain Python floats on the instance - reading ``vec.x`` in a dot
+product must not pay a ctypes descriptor dispatch plus float boxing -
+and the ``Wj*`` struct is created and refreshed only when a value
+actually crosses into C, via ``_sync_to_handle()``.
+"""
+
+import ctypes
+import math
+
+import numpy as np
+
+from .ffi import WjColor, WjVec2, WjVec3, _wj_vec3_new_batch
+
+class Vec2:
+    """2D vector; see ``_sync_to_handle`` for the FFI boundary."""
+
+    __slots__ = ("x", "y", "_handle")
+
+    def __init__(self, x=0.0, y=0.0):
+        self.x = x
+        self.y = y
+        self._handle = None
+
+    def __repr__(self):
+        return f"Vec2({self.x}, {self.y})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Vec2):
+            return NotImplemented
+        return (self.x, self.y) == (other.x, other.y)
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def _sync_to_handle(self):
+        """Write the cached components into the C struct and return it."""
+        handle = self._handle
+        if handle is None:
+            handle = self._handle = WjVec2()
+        handle.x = self.x
+        handle.y = self.y
+        return handle
+
+    def to_bytes(self):
+        """Components packed as contiguous C floats, ready for upload."""
+        return bytes(self._sync_to_handle())
+
+    # ctypes consults _as_parameter_ when an argument is not already an
+    # instance of the declared argtype, so wj_* calls accept these
+    # objects directly: the struct refresh happens once at the call
+    # boundary with no per-site marshalling code.
+    @property
+    def _as_parameter_(self):
+        return self._sync_to_handle()
+
+    def __add__(self, other):
+        return Vec2(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return Vec2(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, scalar):
+        return Vec2(self.x * scalar, self.y * scalar)
+
+    __rmul__ = __mul__
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y
+
+    def length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y)
+
+
+class Vec3:
+    """3D vector; see ``_sync_to_handle`` for the FFI boundary."""
+
+    __slots__ = ("x", "y", "z", "_handle")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self._handle = None
+
+    def __repr__(self):
+        return f"Vec3({self.x}, {self.y}, {self.z})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Vec3):
+            return NotImplemented
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+    def _sync_to_handle(self):
+        """Write the cached components into the C struct and return it."""
+        handle = self._handle
+        if handle is None:
+            handle = self._handle = WjVec3()
+        handle.x = self.x
+        handle.y = self.y
+        handle.z = self.z
+        return handle
+
+    def to_bytes(self):
+        """Components packed as contiguous C floats, ready for upload."""
+        return bytes(self._sync_to_handle())
+
+    # See Vec2._as_parameter_: lets wj_* calls take a Vec3 directly.
+    @property
+    def _as_parameter_(self):
+        return self._sync_to_handle()
+
+    @classmethod
+    def batch_new(cls, arr):
+        """Construct N vectors from an (N, 3) float32 array in one call.
+
+        All handles live in a single contiguous ``(WjVec3 * N)`` block,
+        populated by one ``wj_vec3_new_batch`` crossing (or one memmove
+        when the library isn't built) - the fixed FFI overhead is paid
+        once, not per vector, and the structs sit cache-adjacent.
+        """
+        arr = np.ascontiguousarray(arr, dtype=np.float32)
+        n = len(arr)
+        block = (WjVec3 * n)()
+        xyz = arr.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
+        if _wj_vec3_new_batch is not None:
+            _wj_vec3_new_batch(xyz, n, block)
+        else:
+            ctypes.memmove(block, xyz, n * ctypes.sizeof(WjVec3))
+        vectors = []
+        for i in range(n):
+            v = cls.__new__(cls)
+            v.x = float(arr[i, 0])
+            v.y = float(arr[i, 1])
+            v.z = float(arr[i, 2])
+            v._handle = block[i]
+            vectors.append(v)
+        return vectors
+
+    def __add__(self, other):
+        return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other):
+        return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, scalar):
+        return Vec3(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    __rmul__ = __mul__
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other):
+        return Vec3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    def length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def normalize(self):
+        length = self.length()
+        if length > 1e-8:
+            inv = 1.0 / length
+            return Vec3(self.x * inv, self.y * inv, self.z * inv)
+        return Vec3(0.0, 0.0, 0.0)
+
+
+class Color:
+    """RGBA color; see ``_sync_to_handle`` for the FFI boundary."""
+
+    __slots__ = ("r", "g", "b", "a", "_handle")
+
+    def __init__(self, r=1.0, g=1.0, b=1.0, a=1.0):
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self._handle = None
+
+    def __repr__(self):
+        return f"Color({self.r}, {self.g}, {self.b}, {self.a})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Color):
+            return NotImplemented
+        return (self.r, self.g, self.b, self.a) == (other.r, other.g, other.b, other.a)
+
+    def __hash__(self):
+        return hash((self.r, self.g, self.b, self.a))
+
+    def _sync_to_handle(self):
+        """Write the cached channels into the C struct and return it."""
+        handle = self._handle
+        if handle is None:
+            handle = self._handle = WjColor()
+        handle.r = self.r
+        handle.g = self.g
+        handle.b = self.b
+        handle.a = self.a
+        return handle
+
+    def to_bytes(self):
+        """Channels packed as contiguous C floats, ready for upload."""
+        return bytes(self._sync_to_handle())
+
+    # See Vec2._as_parameter_: lets wj_* calls take a Color directly.
+    @property
+    def _as_parameter_(self):
+        return self._sync_to_handle()
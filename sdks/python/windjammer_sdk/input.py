@@ -0,0 +1,116 @@
+"""Keyboard and mouse input state for the Windjammer Python SDK.
+
+Key and button state is a plain int bitmask indexed by the dense
+``KeyCode`` / ``MouseButton`` values: per-frame queries are one shift
+and mask instead of an enum hash plus set lookup, and press/release
+never allocate.
+"""
+
+from enum import IntEnum
+
+
+class KeyCode(IntEnum):
+    """Keyboard keys with dense values usable as bit indices.
+
+    Comparisons and set membership use the fast int paths; ``str()``
+    still yields the bare key name for debug output and any caller that
+    matched the old string-valued enum.
+    """
+
+    def __str__(self):
+        return self.name
+
+    A = 0
+    B = 1
+    C = 2
+    D = 3
+    E = 4
+    F = 5
+    G = 6
+    H = 7
+    I = 8
+    J = 9
+    K = 10
+    L = 11
+    M = 12
+    N = 13
+    O = 14
+    P = 15
+    Q = 16
+    R = 17
+    S = 18
+    T = 19
+    U = 20
+    V = 21
+    W = 22
+    X = 23
+    Y = 24
+    Z = 25
+    Num0 = 26
+    Num1 = 27
+    Num2 = 28
+    Num3 = 29
+    Num4 = 30
+    Num5 = 31
+    Num6 = 32
+    Num7 = 33
+    Num8 = 34
+    Num9 = 35
+    Space = 36
+    Escape = 37
+    Enter = 38
+    Tab = 39
+    Backspace = 40
+    Left = 41
+    Right = 42
+    Up = 43
+    Down = 44
+    LeftShift = 45
+    RightShift = 46
+    LeftCtrl = 47
+    RightCtrl = 48
+    LeftAlt = 49
+    RightAlt = 50
+
+
+class MouseButton(IntEnum):
+    """Mouse buttons with dense values usable as bit indices."""
+
+    Left = 0
+    Right = 1
+    Middle = 2
+
+
+class Input:
+    """Per-frame keyboard and mouse state."""
+
+    __slots__ = ("_keys", "_mouse_buttons", "mouse_x", "mouse_y")
+
+    def __init__(self):
+        self._keys = 0
+        self._mouse_buttons = 0
+        self.mouse_x = 0.0
+        self.mouse_y = 0.0
+
+    def is_key_pressed(self, key):
+        return bool((self._keys >> key) & 1)
+
+    def press_key(self, key):
+        self._keys |= 1 << key
+
+    def release_key(self, key):
+        self._keys &= ~(1 << key)
+
+    def is_mouse_button_pressed(self, button):
+        return bool((self._mouse_buttons >> button) & 1)
+
+    def press_mouse_button(self, button):
+        self._mouse_buttons |= 1 << button
+
+    def release_mouse_button(self, button):
+        self._mouse_buttons &= ~(1 << button)
+
+    def clear(self):
+        """Drop all held state (e.g. on focus loss)."""
+        self._keys = 0
+        self._mouse_buttons = 0
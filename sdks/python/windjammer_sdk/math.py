@@ -0,0 +1,679 @@
+"""Math value types for the Windjammer Python SDK.
+
+Pure-Python reference implementations. The FFI-backed variants live in
+``ffi_math.py``; both must stay behaviour-compatible.
+
+The scalar value types carry strict float annotations and skip the
+defensive ``float(...)`` coercion on construction: an AOT compiler
+(mypyc/Cython) can then unbox the attributes into C float slots, and
+the interpreter skips a builtin call per component on the hot
+construction path. Callers own the contract of passing real numbers.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+# --- Batched vector math -------------------------------------------------
+#
+# Bulk paths operate on (N, k) float32 ndarrays so a loop over thousands
+# of vectors is one vectorized C pass instead of N interpreter dispatches.
+# Callers convert to numpy once at the edge (Vec3.to_numpy / from_numpy)
+# and stay in array-land for the whole bulk operation.
+
+
+def vec2_add(a, b, out=None):
+    """Element-wise sum of two (N, 2) float32 arrays."""
+    return np.add(a, b, out=out)
+
+
+def vec3_add(a, b, out=None):
+    """Element-wise sum of two (N, 3) float32 arrays."""
+    return np.add(a, b, out=out)
+
+
+def vec3_sub(a, b, out=None):
+    """Element-wise difference of two (N, 3) float32 arrays."""
+    return np.subtract(a, b, out=out)
+
+
+def vec3_scale(a, scalar, out=None):
+    """Scale an (N, 3) float32 array."""
+    return np.multiply(a, scalar, out=out)
+
+
+def vec3_dot(a, b):
+    """Row-wise dot products of two (N, 3) arrays -> (N,) array.
+
+    einsum avoids the (a * b) temporary of the naive form.
+    """
+    return np.einsum("ij,ij->i", a, b)
+
+
+def vec3_cross(a, b):
+    """Row-wise cross products of two (N, 3) arrays -> (N, 3) array."""
+    return np.cross(a, b)
+
+
+def vec3_normalize(a):
+    """Row-wise normalized copies of an (N, 3) array; zero rows stay zero."""
+    lengths = np.sqrt(np.einsum("ij,ij->i", a, a))
+    safe = np.where(lengths > 0.0, lengths, 1.0)
+    return a / safe[:, None]
+
+
+def mat4_multiply_batch(parents, children, out=None):
+    """Pairwise products of two (N, 4, 4) matrix batches -> (N, 4, 4).
+
+    One einsum over the whole transform hierarchy level instead of N
+    Python-level matmuls.
+    """
+    return np.einsum("nij,njk->nik", parents, children, out=out)
+
+
+class Vec2Batch:
+    """N 2D vectors in one C-contiguous (N, 2) float32 array."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, n):
+        self._data = np.zeros((n, 2), dtype=np.float32)
+
+    def __len__(self):
+        return len(self._data)
+
+    x = property(lambda self: self._data[:, 0])
+    y = property(lambda self: self._data[:, 1])
+
+    def __add__(self, other):
+        result = Vec2Batch(len(self))
+        np.add(self._data, other._data, out=result._data)
+        return result
+
+    def __sub__(self, other):
+        result = Vec2Batch(len(self))
+        np.subtract(self._data, other._data, out=result._data)
+        return result
+
+    def dot(self, other):
+        return np.einsum("ij,ij->i", self._data, other._data)
+
+
+class Vec3Batch:
+    """N 3D vectors in one C-contiguous (N, 3) float32 array.
+
+    The batched counterpart to :class:`Vec3` for per-frame bulk work:
+    one vectorized numpy call over the whole array replaces N
+    interpreter round-trips and N result-object allocations. ``.x``,
+    ``.y``, ``.z`` are column views, so writes through them land in the
+    shared block.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, n):
+        self._data = np.zeros((n, 3), dtype=np.float32)
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Pack an iterable of Vec3 into a batch."""
+        vectors = list(vectors)
+        batch = cls(len(vectors))
+        for i, v in enumerate(vectors):
+            batch._data[i, 0] = v.x
+            batch._data[i, 1] = v.y
+            batch._data[i, 2] = v.z
+        return batch
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"Vec3Batch(n={len(self._data)})"
+
+    x = property(lambda self: self._data[:, 0])
+    y = property(lambda self: self._data[:, 1])
+    z = property(lambda self: self._data[:, 2])
+
+    def __add__(self, other):
+        result = Vec3Batch(len(self))
+        np.add(self._data, other._data, out=result._data)
+        return result
+
+    def __sub__(self, other):
+        result = Vec3Batch(len(self))
+        np.subtract(self._data, other._data, out=result._data)
+        return result
+
+    def __mul__(self, scalar):
+        result = Vec3Batch(len(self))
+        np.multiply(self._data, scalar, out=result._data)
+        return result
+
+    __rmul__ = __mul__
+
+    def dot(self, other):
+        """Row-wise dots; einsum skips the (a * b) temporary."""
+        return np.einsum("ij,ij->i", self._data, other._data)
+
+    def dot_batch(self, other, out=None):
+        """Row-wise dots through the native SIMD kernel when available.
+
+        Packs both batches into planar SoA blocks (all x, then y, then
+        z) so wj_vec3_bulk_dot streams full FMA lanes with no shuffles;
+        the pack cost is one transpose-copy per batch, amortized over
+        the whole kernel call. Falls back to ``dot`` without the
+        library.
+        """
+        # Deferred import: math must stay importable without touching
+        # the ctypes layer (see the package __init__).
+        from .ffi import _wj_vec3_bulk_dot
+
+        if _wj_vec3_bulk_dot is None:
+            return self.dot(other)
+        import ctypes
+
+        if out is None:
+            out = np.empty(len(self), dtype=np.float32)
+        a = np.ascontiguousarray(self._data.T)
+        b = np.ascontiguousarray(other._data.T)
+        ptr = ctypes.POINTER(ctypes.c_float)
+        _wj_vec3_bulk_dot(
+            a.ctypes.data_as(ptr),
+            b.ctypes.data_as(ptr),
+            out.ctypes.data_as(ptr),
+            len(self),
+        )
+        return out
+
+    def cross(self, other):
+        result = Vec3Batch(len(self))
+        result._data[:] = np.cross(self._data, other._data)
+        return result
+
+    def lengths(self):
+        return np.sqrt(np.einsum("ij,ij->i", self._data, self._data))
+
+    def normalize_(self):
+        """Normalize every row in place; zero rows stay zero."""
+        lengths = np.sqrt(np.einsum("ij,ij->i", self._data, self._data))
+        self._data /= np.where(lengths > 0.0, lengths, 1.0)[:, None]
+        return self
+
+
+class Vec2:
+    """2D vector."""
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0) -> None:
+        self.x: float = x
+        self.y: float = y
+
+    def __repr__(self):
+        return f"Vec2({self.x}, {self.y})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Vec2):
+            return NotImplemented
+        return (self.x, self.y) == (other.x, other.y)
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __add__(self, other: Vec2) -> Vec2:
+        return Vec2(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: Vec2) -> Vec2:
+        return Vec2(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, scalar: float) -> Vec2:
+        return Vec2(self.x * scalar, self.y * scalar)
+
+    __rmul__ = __mul__
+
+    # In-place variants mutate self and return it; hot loops should
+    # prefer these to avoid one allocation per operation.
+    def __iadd__(self, other: Vec2) -> Vec2:
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other: Vec2) -> Vec2:
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, scalar: float) -> Vec2:
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def dot(self, other: Vec2) -> float:
+        return self.x * other.x + self.y * other.y
+
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y)
+
+    def normalize(self) -> Vec2:
+        # One division + two multiplies instead of two divisions; the
+        # epsilon guard keeps near-zero vectors from blowing up.
+        length = self.length()
+        if length > 1e-8:
+            inv = 1.0 / length
+            return Vec2(self.x * inv, self.y * inv)
+        return Vec2(0.0, 0.0)
+
+    # zero()/one() return shared frozen singletons (assigned below the
+    # class bodies): a `position if position is not None else Vec2.zero()`
+    # default then allocates nothing. Always test `is None` for defaults,
+    # never `position or ...` - `or` would silently replace any vector
+    # that happens to compare falsy. Callers needing a mutable
+    # accumulator must construct Vec2(0.0, 0.0) explicitly.
+    @staticmethod
+    def zero():
+        return Vec2._ZERO
+
+    @staticmethod
+    def one():
+        return Vec2._ONE
+
+
+class Vec3:
+    """3D vector."""
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
+        self.x: float = x
+        self.y: float = y
+        self.z: float = z
+
+    def __repr__(self):
+        return f"Vec3({self.x}, {self.y}, {self.z})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Vec3):
+            return NotImplemented
+        # Single C-level tuple compare, like a dataclass-generated __eq__.
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+    def __add__(self, other: Vec3) -> Vec3:
+        return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: Vec3) -> Vec3:
+        return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, scalar: float) -> Vec3:
+        return Vec3(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    __rmul__ = __mul__
+
+    # In-place variants mutate self and return it: physics integration
+    # (`position += velocity * dt`) then allocates once per step, not
+    # twice. `__add__` stays non-mutating for functional code.
+    def __iadd__(self, other: Vec3) -> Vec3:
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+
+    def __isub__(self, other: Vec3) -> Vec3:
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return self
+
+    def __imul__(self, scalar: float) -> Vec3:
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+
+    # Fused `a + b * t`: integration loops would otherwise allocate a
+    # temporary for `velocity * dt` before the add. One allocation for
+    # the fused form, zero for the trailing-underscore in-place variant
+    # (which, like `__iadd__`, is only safe on vectors the caller owns).
+    def add_scaled(self, other: Vec3, t: float) -> Vec3:
+        return Vec3(self.x + other.x * t, self.y + other.y * t, self.z + other.z * t)
+
+    def add_scaled_(self, other: Vec3, t: float) -> Vec3:
+        self.x += other.x * t
+        self.y += other.y * t
+        self.z += other.z * t
+        return self
+
+    def dot(self, other: Vec3) -> float:
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: Vec3) -> Vec3:
+        return Vec3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def normalize(self) -> Vec3:
+        # Reciprocal-multiply form, as in Vec2.normalize.
+        length = self.length()
+        if length > 1e-8:
+            inv = 1.0 / length
+            return Vec3(self.x * inv, self.y * inv, self.z * inv)
+        return Vec3(0.0, 0.0, 0.0)
+
+    # Shared frozen singletons, as on Vec2.
+    @staticmethod
+    def zero():
+        return Vec3._ZERO
+
+    @staticmethod
+    def one():
+        return Vec3._ONE
+
+    @staticmethod
+    def up():
+        return Vec3._UP
+
+    @classmethod
+    def from_batch(cls, batch, i):
+        """Materialize row ``i`` of a :class:`Vec3Batch` as a Vec3."""
+        row = batch._data[i]
+        return cls(float(row[0]), float(row[1]), float(row[2]))
+
+    @classmethod
+    def from_numpy(cls, arr):
+        """Materialize an (N, 3) array as a list of Vec3 objects.
+
+        Only do this at the edge of a bulk computation; inner loops
+        should stay on the array (see the vec3_* module functions).
+        """
+        return [cls(float(x), float(y), float(z)) for x, y, z in arr]
+
+    @staticmethod
+    def to_numpy(vectors):
+        """Pack an iterable of Vec3 into an (N, 3) float32 array."""
+        return np.array([(v.x, v.y, v.z) for v in vectors], dtype=np.float32)
+
+
+class Vec4:
+    """4D vector."""
+
+    __slots__ = ("x", "y", "z", "w")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, w: float = 0.0) -> None:
+        self.x: float = x
+        self.y: float = y
+        self.z: float = z
+        self.w: float = w
+
+    def __repr__(self):
+        return f"Vec4({self.x}, {self.y}, {self.z}, {self.w})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Vec4):
+            return NotImplemented
+        return (self.x, self.y, self.z, self.w) == (other.x, other.y, other.z, other.w)
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z, self.w))
+
+    def dot(self, other):
+        return (
+            self.x * other.x
+            + self.y * other.y
+            + self.z * other.z
+            + self.w * other.w
+        )
+
+
+class Quat:
+    """Quaternion rotation (scaffolding; matrix conversion is TODO)."""
+
+    __slots__ = ("x", "y", "z", "w")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, w: float = 1.0) -> None:
+        self.x: float = x
+        self.y: float = y
+        self.z: float = z
+        self.w: float = w
+
+    def __repr__(self):
+        return f"Quat({self.x}, {self.y}, {self.z}, {self.w})"
+
+    @staticmethod
+    def identity():
+        return Quat(0.0, 0.0, 0.0, 1.0)
+
+    @staticmethod
+    def to_matrix_batch(quats, out=None):
+        """Convert (N, 4) xyzw quaternions to (N, 4, 4) rotation matrices.
+
+        One broadcast pass over the whole batch instead of a Python loop
+        of per-quaternion trig; element writes land in a preallocated
+        output (pass ``out`` to reuse a buffer across frames). Compose
+        hierarchies with :func:`mat4_multiply_batch`.
+        """
+        q = np.asarray(quats, dtype=np.float32)
+        n = len(q)
+        if out is None:
+            out = np.zeros((n, 4, 4), dtype=np.float32)
+        else:
+            out[:] = 0.0
+        x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+        xx, yy, zz = x * x, y * y, z * z
+        xy, xz, yz = x * y, x * z, y * z
+        wx, wy, wz = w * x, w * y, w * z
+        out[:, 0, 0] = 1.0 - 2.0 * (yy + zz)
+        out[:, 0, 1] = 2.0 * (xy - wz)
+        out[:, 0, 2] = 2.0 * (xz + wy)
+        out[:, 1, 0] = 2.0 * (xy + wz)
+        out[:, 1, 1] = 1.0 - 2.0 * (xx + zz)
+        out[:, 1, 2] = 2.0 * (yz - wx)
+        out[:, 2, 0] = 2.0 * (xz - wy)
+        out[:, 2, 1] = 2.0 * (yz + wx)
+        out[:, 2, 2] = 1.0 - 2.0 * (xx + yy)
+        out[:, 3, 3] = 1.0
+        return out
+
+
+class Color:
+    """RGBA color with float channels."""
+
+    __slots__ = ("r", "g", "b", "a")
+
+    def __init__(self, r: float = 1.0, g: float = 1.0, b: float = 1.0, a: float = 1.0) -> None:
+        self.r: float = r
+        self.g: float = g
+        self.b: float = b
+        self.a: float = a
+
+    def __repr__(self):
+        return f"Color({self.r}, {self.g}, {self.b}, {self.a})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Color):
+            return NotImplemented
+        return (self.r, self.g, self.b, self.a) == (other.r, other.g, other.b, other.a)
+
+    def __hash__(self):
+        return hash((self.r, self.g, self.b, self.a))
+
+    def to_color8(self):
+        """Quantize to a packed :class:`Color8` (clamped to [0, 1])."""
+        def _u8(channel):
+            return int(min(max(channel, 0.0), 1.0) * 255.0 + 0.5)
+
+        return Color8(_u8(self.r), _u8(self.g), _u8(self.b), _u8(self.a))
+
+    # Predefined colors are shared singletons: these get called
+    # per-entity per-frame in render code, so each call should be one
+    # attribute load, not an allocation.
+    @classmethod
+    def white(cls):
+        return cls._WHITE
+
+    @classmethod
+    def black(cls):
+        return cls._BLACK
+
+    @classmethod
+    def red(cls):
+        return cls._RED
+
+    @classmethod
+    def green(cls):
+        return cls._GREEN
+
+    @classmethod
+    def blue(cls):
+        return cls._BLUE
+
+    @classmethod
+    def transparent(cls):
+        return cls._TRANSPARENT
+
+
+class Color8:
+    """RGBA color packed into one uint32 (8 bits per channel).
+
+    The non-HDR counterpart to :class:`Color` for sprite paths: 4 bytes
+    instead of four boxed floats, and a batch of them is a plain
+    ``uint32[N]`` array that uploads to the GPU with zero conversion.
+    Layout is little-endian RGBA (r in the low byte).
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, r, g, b, a=255):
+        self._packed = (a << 24) | (b << 16) | (g << 8) | r
+
+    @classmethod
+    def from_packed(cls, packed):
+        color = cls.__new__(cls)
+        color._packed = packed & 0xFFFFFFFF
+        return color
+
+    def __repr__(self):
+        return f"Color8({self.r}, {self.g}, {self.b}, {self.a})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Color8):
+            return NotImplemented
+        return self._packed == other._packed
+
+    def __hash__(self):
+        return self._packed
+
+    r = property(lambda self: self._packed & 0xFF)
+    g = property(lambda self: (self._packed >> 8) & 0xFF)
+    b = property(lambda self: (self._packed >> 16) & 0xFF)
+    a = property(lambda self: (self._packed >> 24) & 0xFF)
+
+    @property
+    def packed(self):
+        return self._packed
+
+    def to_color(self):
+        """Widen to a float :class:`Color`."""
+        inv = 1.0 / 255.0
+        return Color(self.r * inv, self.g * inv, self.b * inv, self.a * inv)
+
+
+class _FrozenColor(Color):
+    """Shared predefined color; immutable so callers can't corrupt the cache."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("predefined colors are immutable; construct a Color instead")
+
+
+def _frozen_color(r, g, b, a):
+    color = Color.__new__(_FrozenColor)
+    for name, value in zip("rgba", (r, g, b, a)):
+        object.__setattr__(color, name, value)
+    return color
+
+
+class _FrozenVec2(Vec2):
+    """Shared predefined vector; immutable so callers can't corrupt it."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("predefined vectors are immutable; construct a Vec2 instead")
+
+
+class _FrozenVec3(Vec3):
+    """Shared predefined vector; immutable so callers can't corrupt it."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("predefined vectors are immutable; construct a Vec3 instead")
+
+
+def _frozen_vec(cls, *components):
+    vec = cls.__new__(cls)
+    for name, value in zip("xyz", components):
+        object.__setattr__(vec, name, value)
+    return vec
+
+
+Vec2._ZERO = _frozen_vec(_FrozenVec2, 0.0, 0.0)
+Vec2._ONE = _frozen_vec(_FrozenVec2, 1.0, 1.0)
+Vec3._ZERO = _frozen_vec(_FrozenVec3, 0.0, 0.0, 0.0)
+Vec3._ONE = _frozen_vec(_FrozenVec3, 1.0, 1.0, 1.0)
+Vec3._UP = _frozen_vec(_FrozenVec3, 0.0, 1.0, 0.0)
+
+Color._WHITE = _frozen_color(1.0, 1.0, 1.0, 1.0)
+Color._BLACK = _frozen_color(0.0, 0.0, 0.0, 1.0)
+Color._RED = _frozen_color(1.0, 0.0, 0.0, 1.0)
+Color._GREEN = _frozen_color(0.0, 1.0, 0.0, 1.0)
+Color._BLUE = _frozen_color(0.0, 0.0, 1.0, 1.0)
+Color._TRANSPARENT = _frozen_color(0.0, 0.0, 0.0, 0.0)
+
+
+# When numba is installed, route the hot Vec3 methods through the JIT
+# kernels in _math_kernels: each call is then one compiled function with
+# unpacked float arguments instead of interpreter-dispatched arithmetic.
+# Without numba the pure-Python methods above stay in place - the
+# delegation indirection would only add overhead.
+from . import _math_kernels as _kernels
+
+if _kernels.HAVE_NUMBA:
+    def _jit_dot(self, other):
+        return _kernels._dot3(self.x, self.y, self.z, other.x, other.y, other.z)
+
+    def _jit_cross(self, other):
+        x, y, z = _kernels._cross3(self.x, self.y, self.z, other.x, other.y, other.z)
+        return Vec3(x, y, z)
+
+    def _jit_length(self):
+        return _kernels._length3(self.x, self.y, self.z)
+
+    def _jit_normalize(self):
+        x, y, z = _kernels._normalize3(self.x, self.y, self.z)
+        return Vec3(x, y, z)
+
+    Vec3.dot = _jit_dot
+    Vec3.cross = _jit_cross
+    Vec3.length = _jit_length
+    Vec3.normalize = _jit_normalize
+
+
+# Prefer the compiled Vec3 (Cython _math_ext) when the extension is
+# built; the class above is the reference implementation and fallback.
+try:
+    from ._math_ext import Vec3  # noqa: F811
+except ImportError:
+    pass
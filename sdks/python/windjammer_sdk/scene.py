@@ -0,0 +1,247 @@
+"""Scene-graph components for the Windjammer Python SDK.
+
+Transforms and lights store their data SoA-style in pools - one
+float32 array per field, all instances packed together - and the
+component objects are thin (pool, index) proxies whose properties
+return row views. Iterating "all transforms" then walks contiguous
+memory, and bulk updates are single vectorized calls over a pool
+column instead of per-object attribute chases.
+"""
+
+import math
+
+import numpy as np
+
+
+def _compose_matrix(position, rotation, scale, out):
+    """Write a column-major T*R*S world matrix for one transform row.
+
+    ``rotation`` is XYZ Euler angles in radians.
+    """
+    sx, sy, sz = (math.sin(r) for r in rotation)
+    cx, cy, cz = (math.cos(r) for r in rotation)
+
+    # R = Rz @ Ry @ Rx, each column scaled by the matching scale factor.
+    out[0, 0] = cz * cy * scale[0]
+    out[1, 0] = sz * cy * scale[0]
+    out[2, 0] = -sy * scale[0]
+    out[0, 1] = (cz * sy * sx - sz * cx) * scale[1]
+    out[1, 1] = (sz * sy * sx + cz * cx) * scale[1]
+    out[2, 1] = cy * sx * scale[1]
+    out[0, 2] = (cz * sy * cx + sz * sx) * scale[2]
+    out[1, 2] = (sz * sy * cx - cz * sx) * scale[2]
+    out[2, 2] = cy * cx * scale[2]
+    out[0, 3] = position[0]
+    out[1, 3] = position[1]
+    out[2, 3] = position[2]
+    out[3, 0] = out[3, 1] = out[3, 2] = 0.0
+    out[3, 3] = 1.0
+
+
+class TransformPool:
+    """SoA storage for every transform: position/rotation/scale/velocity."""
+
+    __slots__ = (
+        "_capacity", "_count",
+        "position", "rotation", "scale", "velocity",
+        "matrices", "dirty",
+    )
+
+    def __init__(self, capacity=1024):
+        self._capacity = capacity
+        self.position = np.zeros((capacity, 3), dtype=np.float32)
+        self.rotation = np.zeros((capacity, 3), dtype=np.float32)
+        self.scale = np.ones((capacity, 3), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 3), dtype=np.float32)
+        # Cached world matrices, recomposed lazily: static entities (the
+        # common case) pay the trig once, not per frame. The dirty
+        # bitmask is the invalidation channel for both proxy setters
+        # and bulk updates.
+        self.matrices = np.zeros((capacity, 4, 4), dtype=np.float32)
+        self.dirty = np.ones(capacity, dtype=bool)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def allocate(self):
+        if self._count == self._capacity:
+            self._capacity *= 2
+            for name in ("position", "rotation", "scale", "velocity"):
+                column = getattr(self, name)
+                grown = np.zeros((self._capacity, 3), dtype=np.float32)
+                if name == "scale":
+                    grown[:] = 1.0
+                grown[: self._count] = column[: self._count]
+                setattr(self, name, grown)
+            matrices = np.zeros((self._capacity, 4, 4), dtype=np.float32)
+            matrices[: self._count] = self.matrices[: self._count]
+            self.matrices = matrices
+            dirty = np.ones(self._capacity, dtype=bool)
+            dirty[: self._count] = self.dirty[: self._count]
+            self.dirty = dirty
+        index = self._count
+        self._count += 1
+        return index
+
+    def advance(self, dt):
+        """positions += velocities * dt for every live transform at once."""
+        n = self._count
+        self.position[:n] += self.velocity[:n] * dt
+        self.dirty[:n] |= (self.velocity[:n] != 0.0).any(axis=1)
+
+    def world_matrix(self, index):
+        """The cached T*R*S matrix for one row, recomposed only if dirty."""
+        if self.dirty[index]:
+            _compose_matrix(
+                self.position[index],
+                self.rotation[index],
+                self.scale[index],
+                self.matrices[index],
+            )
+            self.dirty[index] = False
+        return self.matrices[index]
+
+
+class LightPool:
+    """SoA storage for point lights: position, color, intensity."""
+
+    __slots__ = ("_capacity", "_count", "position", "color", "intensity")
+
+    def __init__(self, capacity=256):
+        self._capacity = capacity
+        self.position = np.zeros((capacity, 3), dtype=np.float32)
+        self.color = np.ones((capacity, 4), dtype=np.float32)
+        self.intensity = np.ones(capacity, dtype=np.float32)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def allocate(self):
+        if self._count == self._capacity:
+            self._capacity *= 2
+            for name, width in (("position", 3), ("color", 4)):
+                column = getattr(self, name)
+                grown = np.zeros((self._capacity, width), dtype=np.float32)
+                grown[: self._count] = column[: self._count]
+                setattr(self, name, grown)
+            grown = np.ones(self._capacity, dtype=np.float32)
+            grown[: self._count] = self.intensity[: self._count]
+            self.intensity = grown
+        index = self._count
+        self._count += 1
+        return index
+
+
+_default_transforms = TransformPool()
+_default_lights = LightPool()
+
+
+class Transform:
+    """Index-based proxy over one :class:`TransformPool` row."""
+
+    __slots__ = ("_pool", "_index")
+
+    def __init__(self, pool=None, index=None):
+        self._pool = pool if pool is not None else _default_transforms
+        self._index = index if index is not None else self._pool.allocate()
+
+    def __repr__(self):
+        return f"Transform(index={self._index})"
+
+    @property
+    def position(self):
+        return self._pool.position[self._index]
+
+    @position.setter
+    def position(self, value):
+        self._pool.position[self._index] = value
+        self._pool.dirty[self._index] = True
+
+    @property
+    def rotation(self):
+        return self._pool.rotation[self._index]
+
+    @rotation.setter
+    def rotation(self, value):
+        self._pool.rotation[self._index] = value
+        self._pool.dirty[self._index] = True
+
+    @property
+    def scale(self):
+        return self._pool.scale[self._index]
+
+    @scale.setter
+    def scale(self, value):
+        self._pool.scale[self._index] = value
+        self._pool.dirty[self._index] = True
+
+    def world_matrix(self):
+        """Cached world matrix; recomposed only after a setter fired.
+
+        Writes that bypass the setters (mutating a row view directly)
+        must also flip ``pool.dirty[index]`` to invalidate.
+        """
+        return self._pool.world_matrix(self._index)
+
+
+class PointLight:
+    """Index-based proxy over one :class:`LightPool` row."""
+
+    __slots__ = ("_pool", "_index")
+
+    def __init__(self, pool=None, index=None):
+        self._pool = pool if pool is not None else _default_lights
+        self._index = index if index is not None else self._pool.allocate()
+
+    def __repr__(self):
+        return f"PointLight(index={self._index})"
+
+    @property
+    def position(self):
+        return self._pool.position[self._index]
+
+    @position.setter
+    def position(self, value):
+        self._pool.position[self._index] = value
+
+    @property
+    def color(self):
+        return self._pool.color[self._index]
+
+    @color.setter
+    def color(self, value):
+        self._pool.color[self._index] = value
+
+    @property
+    def intensity(self):
+        return float(self._pool.intensity[self._index])
+
+    @intensity.setter
+    def intensity(self, value):
+        self._pool.intensity[self._index] = value
+
+
+class DirectionalLight:
+    """Sun-style light; scenes hold one or two, so no pooling needed."""
+
+    __slots__ = ("direction", "color", "intensity")
+
+    def __init__(self, direction=(0.0, -1.0, 0.0), color=(1.0, 1.0, 1.0, 1.0), intensity=1.0):
+        self.direction = np.asarray(direction, dtype=np.float32)
+        self.color = np.asarray(color, dtype=np.float32)
+        self.intensity = intensity
+
+
+class Camera3D:
+    """Perspective camera; like lights, rare enough to stay un-pooled."""
+
+    __slots__ = ("position", "target", "fov", "near", "far")
+
+    def __init__(self, position=(0.0, 0.0, 5.0), target=(0.0, 0.0, 0.0), fov=60.0):
+        self.position = np.asarray(position, dtype=np.float32)
+        self.target = np.asarray(target, dtype=np.float32)
+        self.fov = fov
+        self.near = 0.1
+        self.far = 1000.0
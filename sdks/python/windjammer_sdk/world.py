@@ -0,0 +1,59 @@
+"""Entity world with SoA component storage for the Windjammer Python SDK."""
+
+import numpy as np
+
+_COMPONENT_WIDTHS = {"position": 3, "velocity": 3}
+
+
+class World:
+    """Entities as row indices into per-component SoA arrays.
+
+    ``query`` hands systems the raw (n_active, width) float32 view once
+    per frame, so per-entity work is numpy expressions over contiguous
+    columns (``positions[:, 0] += velocities[:, 0] * dt``) rather than
+    3N descriptor calls through ``.x/.y/.z`` attribute chains.
+    """
+
+    __slots__ = ("_capacity", "_columns", "_count")
+
+    def __init__(self, capacity=1024):
+        self._capacity = capacity
+        self._columns = {
+            name: np.zeros((capacity, width), dtype=np.float32)
+            for name, width in _COMPONENT_WIDTHS.items()
+        }
+        self._count = 0
+
+    def spawn(self, position=None, velocity=None):
+        """Create an entity; returns its row index."""
+        if self._count == self._capacity:
+            self._capacity *= 2
+            for name, column in self._columns.items():
+                grown = np.zeros((self._capacity, column.shape[1]), dtype=np.float32)
+                grown[: self._count] = column[: self._count]
+                self._columns[name] = grown
+        index = self._count
+        self._count += 1
+        if position is not None:
+            self._columns["position"][index] = position
+        if velocity is not None:
+            self._columns["velocity"][index] = velocity
+        return index
+
+    @property
+    def entity_count(self):
+        return self._count
+
+    def query(self, component):
+        """The live (n_active, width) float32 view of one component column.
+
+        Writes through the view update the world; fetch it once per
+        frame and stay in array-land for the whole pass.
+        """
+        return self._columns[component][: self._count]
+
+    def integrate(self, dt):
+        """Advance positions by velocities in one fused vectorized pass."""
+        positions = self.query("position")
+        velocities = self.query("velocity")
+        positions += velocities * dt